@@ -9,12 +9,16 @@ based on your terminal context, with support for Model Context Protocol
 __version__ = "0.2.1"
 __author__ = "AIxTerm Team"
 
-from .cleanup import CleanupManager
-from .config import AIxTermConfig
-from .context import TerminalContext
-from .display import DisplayManager, create_display_manager
-from .llm import LLMClient
-from .mcp_client import MCPClient
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .cleanup import CleanupManager
+    from .config import AIxTermConfig
+    from .context import TerminalContext
+    from .display import DisplayManager, create_display_manager
+    from .llm import LLMClient
+    from .mcp_client import MCPClient
 
 __all__ = [
     "AIxTermConfig",
@@ -25,3 +29,26 @@ __all__ = [
     "MCPClient",
     "CleanupManager",
 ]
+
+# Public name -> submodule. Submodules are imported on first attribute access so
+# that importing a light subpackage (e.g. aixterm.integration from the shell
+# hooks) does not pull in the LLM and MCP client stacks.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "AIxTermConfig": ".config",
+    "TerminalContext": ".context",
+    "DisplayManager": ".display",
+    "create_display_manager": ".display",
+    "LLMClient": ".llm",
+    "MCPClient": ".mcp_client",
+    "CleanupManager": ".cleanup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the package's public exports (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
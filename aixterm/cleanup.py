@@ -128,6 +128,7 @@ class CleanupManager:
                 if file_time < cutoff_date:
                     file_size = log_file.stat().st_size
                     log_file.unlink()
+                    self._remove_end_marker(log_file)
                     results["log_files_removed"] += 1
                     results["bytes_freed"] += file_size
                     self.logger.debug(f"Removed old inactive log file: {log_file}")
@@ -148,6 +149,7 @@ class CleanupManager:
                 try:
                     file_size = log_file.stat().st_size
                     log_file.unlink()
+                    self._remove_end_marker(log_file)
                     results["log_files_removed"] += 1
                     results["bytes_freed"] += file_size
                     self.logger.debug(f"Removed excess inactive log file: {log_file}")
@@ -249,6 +251,17 @@ class CleanupManager:
         """Get list of all AIxTerm log files in new tty directory."""
         return list((Path.home() / ".aixterm" / "tty").glob("*.log"))
 
+    def _remove_end_marker(self, log_file: Path) -> None:
+        """Remove the clean-exit marker the shell integrations leave next to a log.
+
+        A leftover marker would make the next session on that TTY treat its
+        predecessor as having ended cleanly.
+
+        Args:
+            log_file: Path to the removed log file
+        """
+        log_file.with_suffix(".log.ended").unlink(missing_ok=True)
+
     def _get_active_ttys(self) -> List[str]:
         """Get list of currently active TTY sessions.
 
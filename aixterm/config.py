@@ -69,6 +69,8 @@ class AIxTermConfig:
             ),
             "api_url": "http://localhost/v1/chat/completions",
             "api_key": "",
+            "http2": True,
+            "stream_chunk_size": 65536,
             "context_size": 4096,
             "response_buffer_size": 1024,
             "mcp_servers": [
@@ -89,6 +91,7 @@ class AIxTermConfig:
             "tool_management": {
                 "reserve_tokens_for_tools": 1024,
                 "max_tool_iterations": 5,
+                "parallel_tool_calls": True,
                 "response_timing": {
                     "average_response_time": 10.0,
                     "max_progress_time": 30.0,
@@ -150,6 +153,24 @@ class AIxTermConfig:
         if not isinstance(config.get("api_url"), str) or not config.get("api_url"):
             config["api_url"] = defaults["api_url"]
 
+        # http2 (only takes effect when the h2 package is installed)
+        if isinstance(config.get("http2"), str):
+            config["http2"] = config["http2"].lower() in {"true", "yes", "1"}
+        elif not isinstance(config.get("http2"), bool):
+            config["http2"] = defaults["http2"]
+
+        # stream_chunk_size (initial read size for streamed responses)
+        try:
+            config["stream_chunk_size"] = max(
+                1024,
+                min(
+                    1048576,
+                    int(config.get("stream_chunk_size", defaults["stream_chunk_size"])),
+                ),
+            )
+        except (ValueError, TypeError):
+            config["stream_chunk_size"] = defaults["stream_chunk_size"]
+
         # mcp_servers
         if not isinstance(config.get("mcp_servers"), list):
             config["mcp_servers"] = []
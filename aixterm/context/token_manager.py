@@ -1,6 +1,9 @@
 """Token management and estimation for context optimization."""
 
-from typing import Any, Optional
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 # tiktoken is optional at runtime; provide graceful fallbacks when unavailable
 try:  # pragma: no cover - exercised via integration, not unit tests
@@ -8,6 +11,10 @@ try:  # pragma: no cover - exercised via integration, not unit tests
 except Exception:  # pragma: no cover - fallback path
     tiktoken = None  # type: ignore
 
+# Bound for the tools token cache; tool optimization probes many subsets of
+# the catalog, so keep recent ones without growing without limit.
+_TOOL_TOKEN_CACHE_SIZE = 128
+
 
 class TokenManager:
     """Handles token estimation and management for context optimization."""
@@ -21,6 +28,8 @@ class TokenManager:
         """
         self.config = config_manager
         self.logger = logger
+        # (digest of the tools JSON, tokenizer model) -> token count
+        self._tool_token_cache: "OrderedDict[Tuple[bytes, str], int]" = OrderedDict()
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text.
@@ -116,13 +125,19 @@ class TokenManager:
         return max(0, tool_budget)
 
     def count_tokens_for_messages(
-        self, messages: list, model_name: Optional[str] = None
+        self,
+        messages: list,
+        model_name: Optional[str] = None,
+        include_conversation_overhead: bool = True,
     ) -> int:
         """Count tokens for a list of messages including OpenAI format overhead.
 
         Args:
             messages: List of message dictionaries
             model_name: Model name for tokenizer (uses config default if None)
+            include_conversation_overhead: Add the fixed per-conversation
+                overhead; pass False when counting messages appended to an
+                already counted conversation
 
         Returns:
             Total token count including message formatting overhead
@@ -165,7 +180,8 @@ class TokenManager:
                     total_tokens += len(encoding.encode(str(value)))
 
         # Add overhead for conversation structure
-        total_tokens += 2  # Conversation-level overhead
+        if include_conversation_overhead:
+            total_tokens += 2  # Conversation-level overhead
 
         return total_tokens
 
@@ -188,10 +204,24 @@ class TokenManager:
             model_name = self.config.get("model", "gpt-3.5-turbo")
 
         try:
-            import json
-
             tools_json = json.dumps(tools)
-            return self.estimate_tokens(tools_json)
+            # The tool catalog rarely changes between requests; key by content
+            # so mutated or rebuilt lists stay correct. estimate_tokens picks
+            # its tokenizer from the configured model, so key by that too.
+            key = (
+                hashlib.blake2b(tools_json.encode("utf-8"), digest_size=8).digest(),
+                self.config.get("model", ""),
+            )
+            cached = self._tool_token_cache.get(key)
+            if cached is not None:
+                self._tool_token_cache.move_to_end(key)
+                return cached
+
+            tokens = self.estimate_tokens(tools_json)
+            self._tool_token_cache[key] = tokens
+            if len(self._tool_token_cache) > _TOOL_TOKEN_CACHE_SIZE:
+                self._tool_token_cache.popitem(last=False)
+            return tokens
         except Exception as e:
             self.logger.warning(f"Tools token counting failed: {e}")
             # Fallback estimation
@@ -213,8 +243,6 @@ class TokenManager:
             model_name = self.config.get("model", "gpt-3.5-turbo")
 
         try:
-            import json
-
             payload_json = json.dumps(payload)
             return self.estimate_tokens(payload_json)
         except Exception as e:
@@ -1,6 +1,6 @@
 """Tool optimization for context management."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Optional tiktoken import; we will primarily rely on TokenManager
 try:  # pragma: no cover
@@ -23,6 +23,12 @@ class ToolOptimizer:
         self.config = config_manager
         self.logger = logger
         self.token_manager = token_manager
+        # Last full message count: (id of the list, first message, counted
+        # length, last counted message, model, tokens). The tool loop only
+        # appends to the conversation, so later counts reuse the prefix.
+        self._message_tokens_cache: Optional[
+            Tuple[int, Dict, int, Dict, str, int]
+        ] = None
 
     def optimize_tools_for_context(
         self, tools: List[Dict], query: str, available_tokens: int
@@ -224,6 +230,49 @@ class ToolOptimizer:
         )
         return fitted_tools
 
+    def _count_message_tokens(self, messages: List[Dict], model: str) -> int:
+        """Count message tokens, re-counting only newly appended messages.
+
+        Args:
+            messages: Conversation messages
+            model: Model name for tokenizer
+
+        Returns:
+            Token count matching TokenManager.count_tokens_for_messages (to
+            within rounding when it falls back to the character heuristic)
+        """
+        if not messages:
+            return 0
+
+        cached = self._message_tokens_cache
+        if (
+            cached is not None
+            and cached[0] == id(messages)
+            and cached[1] is messages[0]
+            and len(messages) >= cached[2]
+            and messages[cached[2] - 1] is cached[3]
+            and cached[4] == model
+        ):
+            counted_len, tokens = cached[2], cached[5]
+            if len(messages) > counted_len:
+                tokens += self.token_manager.count_tokens_for_messages(
+                    messages[counted_len:],
+                    model,
+                    include_conversation_overhead=False,
+                )
+        else:
+            tokens = self.token_manager.count_tokens_for_messages(messages, model)
+
+        self._message_tokens_cache = (
+            id(messages),
+            messages[0],
+            len(messages),
+            messages[-1],
+            model,
+            tokens,
+        )
+        return tokens
+
     def manage_context_with_tools(
         self, messages: List[Dict], tools: Optional[List[Dict]] = None
     ) -> Optional[Dict[str, Any]]:
@@ -246,12 +295,13 @@ class ToolOptimizer:
             - self.config.get_response_buffer_size()
         )
 
-        # Start with current tools
-        current_tools = tools.copy() if tools else None
+        # Start with current tools. The caller's list is only ever rebound below
+        # (optimization builds a new list), never mutated, so no copy is needed.
+        current_tools = tools if tools else None
 
         # Calculate total tokens needed
         def calculate_total_tokens() -> int:
-            msg_tokens = self.token_manager.count_tokens_for_messages(messages, model)
+            msg_tokens = self._count_message_tokens(messages, model)
             tool_tokens = (
                 self.token_manager.count_tokens_for_tools(current_tools, model)
                 if current_tools
@@ -286,7 +336,7 @@ class ToolOptimizer:
                         break
 
             available_tokens = self.token_manager.get_available_tool_tokens(
-                self.token_manager.count_tokens_for_messages(messages, model)
+                self._count_message_tokens(messages, model)
             )
             current_tools = self.optimize_tools_for_context(
                 current_tools, query_text, available_tokens
@@ -319,9 +369,7 @@ class ToolOptimizer:
 
             # Use token manager to trim messages
             # First, let's calculate how much we need to trim
-            current_msg_tokens = self.token_manager.count_tokens_for_messages(
-                messages, model
-            )
+            current_msg_tokens = self._count_message_tokens(messages, model)
             if current_msg_tokens > available_for_messages:
                 # Simple message trimming: keep system message and recent messages
                 trimmed_messages = []
@@ -357,9 +405,7 @@ class ToolOptimizer:
             total_tokens = calculate_total_tokens()
 
             if total_tokens <= max_context:
-                final_msg_tokens = self.token_manager.count_tokens_for_messages(
-                    messages, model
-                )
+                final_msg_tokens = self._count_message_tokens(messages, model)
                 final_tool_tokens = (
                     self.token_manager.count_tokens_for_tools(current_tools, model)
                     if current_tools
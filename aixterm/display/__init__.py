@@ -6,7 +6,6 @@ including progress bars, streaming content, status messages, and terminal contro
 
 from .content import ContentStreamer
 from .manager import DisplayManager
-from .progress import _MockProgress, _ProgressDisplay
 from .status import StatusDisplay
 from .terminal import TerminalController
 from .types import DisplayType, MessageType
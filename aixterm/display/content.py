@@ -2,15 +2,34 @@
 
 import re
 import sys
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..utils import get_logger
 from .types import DisplayType
 
+# Streaming state bits packed into ContentStreamer._state
+_STREAMING = 1
+_THINKING = 2
+
+# Special tags recognised while streaming; each named group maps to a handler
+_TAG_RE = re.compile(r"(?P<think_open><thinking>)|(?P<think_close></thinking>)")
+
+# Patterns for filtering complete (non-streamed) content
+_THINKING_BLOCK_RE = re.compile(r"<thinking>.*?</thinking>", re.DOTALL)
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
 
 class ContentStreamer:
     """Handles streaming content to the terminal with special tag processing."""
 
+    __slots__ = (
+        "logger",
+        "_parent",
+        "_state",
+        "_handlers",
+        "_thinking_progress",
+    )
+
     def __init__(self, parent_manager: Any):  # Use Any to avoid circular imports
         """Initialize content streamer.
 
@@ -20,9 +39,13 @@ class ContentStreamer:
         self.logger = get_logger(__name__)
         self._parent = parent_manager
 
-        # Streaming state
-        self._streaming_active = False
-        self._thinking_active = False
+        # Streaming state: combination of _STREAMING and _THINKING bits
+        self._state = 0
+        # Tag handlers keyed by _TAG_RE group name
+        self._handlers: Dict[str, Callable[["re.Match[str]", int, List[str]], int]] = {
+            "think_open": self._on_thinking_open,
+            "think_close": self._on_thinking_close,
+        }
         self._thinking_progress: Optional[Any] = (
             None  # Using Any to avoid circular imports
         )
@@ -36,7 +59,7 @@ class ContentStreamer:
         if clear_progress:
             self._parent.clear_all_progress()
             self._parent.clear_terminal_line()
-        self._streaming_active = True
+        self._state |= _STREAMING
 
     def stream_content(self, content: str, filter_thinking: bool = True) -> str:
         """Stream content to output, handling thinking tags if needed.
@@ -54,7 +77,8 @@ class ContentStreamer:
         if filter_thinking:
             return self._process_thinking_content(content)
         else:
-            print(content, end="", flush=True)
+            sys.stdout.write(content)
+            sys.stdout.flush()
             return content
 
     def end_streaming(self, add_newline: bool = True) -> None:
@@ -63,9 +87,10 @@ class ContentStreamer:
         Args:
             add_newline: Whether to add a final newline
         """
-        if self._streaming_active and add_newline:
-            print()  # Add newline after streaming
-        self._streaming_active = False
+        if self._state & _STREAMING and add_newline:
+            sys.stdout.write("\n")  # Add newline after streaming
+            sys.stdout.flush()
+        self._state &= ~_STREAMING
 
         # Clean up thinking progress if active
         if self._thinking_progress:
@@ -75,7 +100,7 @@ class ContentStreamer:
                 self.logger.debug(f"Error completing thinking progress: {e}")
             finally:
                 self._thinking_progress = None
-        self._thinking_active = False
+        self._state = 0
 
     def _process_thinking_content(self, content: str) -> str:
         """Process content for thinking tags and handle display appropriately.
@@ -86,46 +111,61 @@ class ContentStreamer:
         Returns:
             Content that was actually output (thinking filtered)
         """
-        output_text = ""
-        remaining_content = content
-
-        while remaining_content:
-            if not self._thinking_active:
-                # Look for thinking start
-                thinking_start = remaining_content.find("<thinking>")
-                if thinking_start == -1:
-                    # No thinking content, output everything
-                    output_text += remaining_content
-                    print(remaining_content, end="", flush=True)
-                    break
-                else:
-                    # Output content before thinking
-                    before_thinking = remaining_content[:thinking_start]
-                    if before_thinking:
-                        output_text += before_thinking
-                        print(before_thinking, end="", flush=True)
-
-                    # Start thinking mode
-                    self._thinking_active = True
-                    self._start_thinking_progress()
-                    remaining_content = remaining_content[
-                        thinking_start + 10 :
-                    ]  # Skip "<thinking>"
-            else:
-                # In thinking mode, look for end
-                thinking_end = remaining_content.find("</thinking>")
-                if thinking_end == -1:
-                    # No end tag yet, consume all remaining content silently
-                    break
-                else:
-                    # End thinking mode
-                    self._thinking_active = False
-                    self._end_thinking_progress()
-                    remaining_content = remaining_content[
-                        thinking_end + 11 :
-                    ]  # Skip "</thinking>"
-
-        return output_text
+        output_parts: List[str] = []
+        handlers = self._handlers
+        pos = 0
+
+        # Single pass over every tag boundary, dispatched by group name
+        for match in _TAG_RE.finditer(content):
+            pos = handlers[match.lastgroup or ""](match, pos, output_parts)
+
+        # Anything after the last tag is visible unless still thinking
+        if not self._state & _THINKING:
+            self._write_visible(content[pos:], output_parts)
+
+        return "".join(output_parts)
+
+    def _write_visible(self, visible: str, output_parts: List[str]) -> None:
+        """Output a span of visible (non-thinking) content."""
+        if visible:
+            output_parts.append(visible)
+            sys.stdout.write(visible)
+            sys.stdout.flush()
+
+    def _on_thinking_open(
+        self, match: "re.Match[str]", pos: int, output_parts: List[str]
+    ) -> int:
+        """Handle a thinking start tag.
+
+        Returns:
+            Position of the first character not yet output or consumed
+        """
+        if self._state & _THINKING:
+            # Nested start tag inside thinking content is consumed silently
+            return match.end()
+
+        # Output content before thinking, then start thinking mode
+        self._write_visible(match.string[pos : match.start()], output_parts)
+        self._state |= _THINKING
+        self._start_thinking_progress()
+        return match.end()
+
+    def _on_thinking_close(
+        self, match: "re.Match[str]", pos: int, output_parts: List[str]
+    ) -> int:
+        """Handle a thinking end tag.
+
+        Returns:
+            Position of the first character not yet output or consumed
+        """
+        if not self._state & _THINKING:
+            # Stray end tag outside thinking content stays visible
+            return pos
+
+        # End thinking mode
+        self._state &= ~_THINKING
+        self._end_thinking_progress()
+        return match.end()
 
     def filter_thinking_content(self, content: str) -> str:
         """Filter out thinking content from text (for non-streaming use).
@@ -137,10 +177,10 @@ class ContentStreamer:
             Content with thinking sections removed
         """
         # Remove thinking content using regex
-        filtered = re.sub(r"<thinking>.*?</thinking>", "", content, flags=re.DOTALL)
+        filtered = _THINKING_BLOCK_RE.sub("", content)
 
         # Clean up extra whitespace
-        filtered = re.sub(r"\n\s*\n\s*\n", "\n\n", filtered)
+        filtered = _EXTRA_BLANK_LINES_RE.sub("\n\n", filtered)
         return filtered.strip()
 
     def _start_thinking_progress(self) -> None:
@@ -178,14 +218,12 @@ class ContentStreamer:
             return
 
         # Start streaming mode if not already active
-        if not self._streaming_active:
+        if not self._state & _STREAMING:
             self.start_streaming()
 
-        print("\033[3m\033[2m", end="")  # Italic and dim text
-        print("Thinking:", file=sys.stderr)
-        print(thinking_content, file=sys.stderr)
-        print("\033[0m", end="")  # Reset formatting
-        print("\n", end="", file=sys.stderr)
+        # Italic and dim text, reset afterwards, emitted as a single write
+        sys.stderr.write(f"\033[3m\033[2mThinking:\n{thinking_content}\n\033[0m\n")
+        sys.stderr.flush()
 
     def show_response(self, response_content: str) -> None:
         """Show response content with appropriate formatting.
@@ -197,8 +235,9 @@ class ContentStreamer:
             return
 
         # Start streaming mode if not already active
-        if not self._streaming_active:
+        if not self._state & _STREAMING:
             self.start_streaming()
 
-        # Just print the response directly
-        print(response_content)
+        # Just write the response directly
+        sys.stdout.write(f"{response_content}\n")
+        sys.stdout.flush()
@@ -1,14 +1,17 @@
 """Unified display system for AIxTerm."""
 
+import queue
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional, Union
+from typing import ContextManager, Dict, Optional, Tuple, Union
 
 from ..utils import get_logger
-from .progress import _MockProgress, _ProgressDisplay
+from .progress import _MOCK_PROGRESS, _ProgressDisplay
 from .types import DisplayType, MessageType
 
+# (display, progress, message, total) as queued by update_progress
+_UpdateItem = Tuple[_ProgressDisplay, int, Optional[str], Optional[int]]
+
 
 class DisplayManager:
     """Unified display manager for all AIxTerm output operations.
@@ -45,13 +48,17 @@ class DisplayManager:
         self.status = StatusDisplay(self)
         self.terminal = TerminalController(self)
 
-        # Background thread executor for safe updates
-        self._update_executor = ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="display-update"
+        # Background worker thread for safe updates
+        self._update_queue: "queue.Queue[Optional[_UpdateItem]]" = queue.Queue()
+        self._update_inflight = threading.Lock()
+        # Updates queued or dequeued by the worker but not yet applied; an
+        # update may only run inline while this is zero
+        self._update_pending = 0
+        self._update_pending_lock = threading.Lock()
+        self._update_thread = threading.Thread(
+            target=self._update_worker, name="display-update", daemon=True
         )
-
-        # Terminal control
-        self._last_clear_time = 0.0
+        self._update_thread.start()
 
     # ===== PROGRESS DISPLAY METHODS =====
 
@@ -82,7 +89,7 @@ class DisplayManager:
             token = "default"
         with self._progress_lock:
             if self._shutdown:
-                return _MockProgress()
+                return _MOCK_PROGRESS
 
             if token in self._active_progress:
                 return self._active_progress[token]
@@ -131,12 +138,27 @@ class DisplayManager:
             return
 
         with self._progress_lock:
-            if token in self._active_progress:
-                display = self._active_progress[token]
-                # Use thread pool to prevent blocking
-                self._update_executor.submit(
-                    self._safe_progress_update, display, progress, message, total
-                )
+            display = self._active_progress.get(token)
+        if display is None:
+            return
+
+        # Apply inline when no update is pending (queued, or dequeued by the
+        # worker but not yet applied) and none is being applied. Checking the
+        # counter and taking the lock together keeps updates in order; the
+        # common uncontended case skips the thread handoff.
+        with self._update_pending_lock:
+            inline = not self._update_pending and self._update_inflight.acquire(
+                blocking=False
+            )
+            if not inline:
+                # Hand off to the worker thread to prevent blocking
+                self._update_pending += 1
+                self._update_queue.put((display, progress, message, total))
+        if inline:
+            try:
+                self._safe_progress_update(display, progress, message, total)
+            finally:
+                self._update_inflight.release()
 
     def complete_progress(
         self, token: Union[str, int], final_message: Optional[str] = None
@@ -156,6 +178,7 @@ class DisplayManager:
                     self.logger.debug(f"Error completing progress {token}: {e}")
                 finally:
                     del self._active_progress[token]
+                self._clear_progress_line()
 
     def clear_all_progress(self) -> None:
         """Clear all active progress displays."""
@@ -177,8 +200,49 @@ class DisplayManager:
 
         # Ensure terminal is completely clean after clearing all progress
         if active_tokens:
-            sys.stderr.write("\r\033[K")
-            sys.stderr.flush()
+            self._clear_progress_line()
+
+    def _clear_progress_line(self) -> None:
+        """Clear line artifacts left behind by completed progress bars."""
+        sys.stderr.write("\r\033[K")
+        sys.stderr.flush()
+
+    def _update_worker(self) -> None:
+        """Drain queued progress updates, coalescing bursts per display."""
+        update_queue = self._update_queue
+        while True:
+            item = update_queue.get()
+            if item is None:
+                return
+
+            with self._update_inflight:
+                # Collapse consecutive updates to the same display into the latest
+                taken = 1
+                while True:
+                    try:
+                        newer = update_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if newer is None:
+                        self._safe_progress_update(*item)
+                        return
+                    taken += 1
+                    if newer[0] is not item[0]:
+                        self._safe_progress_update(*item)
+                        item = newer
+                    else:
+                        # Keep the latest message/total seen for this display
+                        item = (
+                            newer[0],
+                            newer[1],
+                            item[2] if newer[2] is None else newer[2],
+                            item[3] if newer[3] is None else newer[3],
+                        )
+
+                self._safe_progress_update(*item)
+                # Only now may producers apply updates inline again
+                with self._update_pending_lock:
+                    self._update_pending -= taken
 
     def _safe_progress_update(
         self,
@@ -187,7 +251,7 @@ class DisplayManager:
         message: Optional[str],
         total: Optional[int],
     ) -> None:
-        """Safely update progress in background thread."""
+        """Safely update progress inline or from the background thread."""
         try:
             display.update(progress, message, total)
         except Exception as e:
@@ -273,6 +337,10 @@ class DisplayManager:
         """Show a tool call message."""
         self.status.show_tool_call(tool_name, clear_progress)
 
+    def batch_messages(self) -> ContextManager[None]:
+        """Group a burst of status messages into one write (see StatusDisplay.batch)."""
+        return self.status.batch()
+
     # ===== TERMINAL CONTROL METHODS =====
 
     def clear_terminal_line(self) -> None:
@@ -287,6 +355,7 @@ class DisplayManager:
             self._shutdown = True
 
             # Complete all active progress
+            had_progress = bool(self._active_progress)
             for progress in list(self._active_progress.values()):
                 try:
                     progress.complete("Cancelled")
@@ -294,13 +363,22 @@ class DisplayManager:
                     self.logger.debug(f"Error during shutdown: {e}")
 
             self._active_progress.clear()
+            if had_progress:
+                self._clear_progress_line()
             self._position_counter = 0
 
-            # Shutdown executor gracefully
-            try:
-                self._update_executor.shutdown(wait=True, cancel_futures=True)
-            except Exception as e:
-                self.logger.debug(f"Error shutting down executor: {e}")
+        try:
+            self.status.flush()
+        except Exception as e:
+            self.logger.debug(f"Error flushing status output: {e}")
+
+        # Stop the update worker; pending updates target completed displays
+        try:
+            self._update_queue.put(None)
+            if self._update_thread is not threading.current_thread():
+                self._update_thread.join(timeout=1.0)
+        except Exception as e:
+            self.logger.debug(f"Error stopping update worker: {e}")
 
     def show_response(self, response: Union[Dict, str]) -> None:
         """Display a response from the LLM.
@@ -335,7 +413,7 @@ class DisplayManager:
 
         except Exception as e:
             self.logger.error(f"Error displaying response: {e}")
-            print(f"Error displaying response: {e}", file=sys.stderr)
+            sys.stderr.write(f"Error displaying response: {e}\n")
 
 
 def create_display_manager(display_type: str = "bar") -> DisplayManager:
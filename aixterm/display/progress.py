@@ -3,17 +3,95 @@
 import sys
 import threading
 import time
-from typing import Any, Optional, Union
-
-from tqdm import tqdm
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
 from ..utils import get_logger
 from .types import DisplayType
 
+if TYPE_CHECKING:
+    from tqdm import tqdm
+
+# Minimum spacing between rate-limited progress redraws
+_MIN_UPDATE_INTERVAL_NS = 100_000_000
+
+# tqdm settings shared by every display type ("desc" and "file" are set per call)
+_TQDM_BASE_KWARGS: Dict[str, Any] = {
+    "leave": False,
+    "unit": "items",
+    "disable": False,
+    "dynamic_ncols": True,
+    "ascii": False,
+    "mininterval": 0.1,
+    "maxinterval": 1.0,
+    "smoothing": 0.1,
+    "position": None,
+    "ncols": 70,
+    "colour": None,
+}
+
+# Per display type overrides, keyed by (display_type, has_total)
+_SIMPLE_KWARGS: Dict[str, Any] = {
+    "bar_format": "{desc}: {n} items",
+    "ncols": 60,
+}
+_SPINNER_KWARGS: Dict[str, Any] = {
+    "bar_format": "{desc}: {n} items [{elapsed}]",
+    "ncols": 60,
+}
+_TQDM_TYPE_KWARGS: Dict[Tuple[DisplayType, bool], Dict[str, Any]] = {
+    (DisplayType.SIMPLE, True): _SIMPLE_KWARGS,
+    (DisplayType.SIMPLE, False): _SIMPLE_KWARGS,
+    (DisplayType.PROGRESS_BAR, True): {
+        "bar_format": "{desc}: {percentage:3.0f}%|{bar}| "
+        "{n}/{total} [{elapsed}<{remaining}]",
+        "ncols": 80,
+    },
+    (DisplayType.PROGRESS_BAR, False): {
+        "bar_format": "{desc} [{elapsed}]",
+        "ncols": 60,
+    },
+    (DisplayType.SPINNER, True): _SPINNER_KWARGS,
+    (DisplayType.SPINNER, False): _SPINNER_KWARGS,
+    (DisplayType.DETAILED, True): {
+        "bar_format": "{desc}: {percentage:3.0f}%|{bar}| "
+        "{n}/{total} [{elapsed}<{remaining}, {rate_fmt}]",
+        "ncols": 100,
+        "unit_scale": True,
+    },
+    (DisplayType.DETAILED, False): {
+        "bar_format": "{desc}: {n} items [{elapsed}, {rate_fmt}]",
+        "ncols": 80,
+        "unit_scale": True,
+    },
+}
+
 
 class _ProgressDisplay:
     """Individual progress display implementation."""
 
+    __slots__ = (
+        "token",
+        "title",
+        "total",
+        "display_type",
+        "position",
+        "manager",
+        "current_progress",
+        "message",
+        "is_visible",
+        "is_completed",
+        "_last_update_ns",
+        "_tqdm",
+        "_tqdm_lock",
+        "_tq_set_desc",
+        "_last_desc",
+        "_tq_refresh",
+        "logger",
+    )
+
+    # tqdm class, imported on first use to keep it off the CLI startup path
+    _tqdm_cls: Optional[type] = None
+
     def __init__(
         self,
         token: Union[str, int],
@@ -44,11 +122,16 @@ class _ProgressDisplay:
         self.message = ""
         self.is_visible = False
         self.is_completed = False
-        self._last_update = 0.0
+        self._last_update_ns = 0
 
         # tqdm instance
-        self._tqdm: Optional[tqdm] = None
+        self._tqdm: Optional["tqdm"] = None
         self._tqdm_lock = threading.Lock()
+        # Bound tqdm methods for the update hot path
+        self._tq_set_desc: Optional[Callable[..., None]] = None
+        # Description last pushed to tqdm, to skip redundant re-formatting
+        self._last_desc = ""
+        self._tq_refresh: Optional[Callable[[], None]] = None
 
         self.logger = get_logger(__name__)
 
@@ -65,50 +148,63 @@ class _ProgressDisplay:
         if self.is_completed:
             return
 
-        # Rate limiting
-        current_time = time.time()
-        time_diff = current_time - self._last_update
-        progress_diff = abs(progress - self.current_progress)
-
-        if time_diff >= 0.1 and time_diff > 0.001 and progress_diff < 5:
+        # Rate limiting: drop small progress-only steps within 100ms
+        current_ns = time.monotonic_ns()
+        if (
+            current_ns - self._last_update_ns < _MIN_UPDATE_INTERVAL_NS
+            and abs(progress - self.current_progress) < 5
+            and total is None
+            and (message is None or message == self.message)
+        ):
             return
-        self._last_update = current_time
+        self._last_update_ns = current_ns
 
         # Update total if provided
         if total is not None and total != self.total:
             old_total = self.total
             self.total = total
+            recreate = False
             with self._tqdm_lock:
-                if self._tqdm:
+                tq = self._tqdm
+                if tq is not None:
                     try:
-                        if old_total is None and total is not None:
-                            # Recreate for indeterminate to determinate
-                            old_desc = self._tqdm.desc
-                            old_n = self._tqdm.n
-                            self._tqdm.close()
-                            self._create_tqdm()
-                            if self._tqdm:
-                                self._tqdm.n = old_n
-                                self._tqdm.set_description(old_desc)
-                                self._tqdm.refresh()
+                        if old_total is None:
+                            # Indeterminate to determinate: reset in place and
+                            # switch to the determinate format for this type
+                            old_n = tq.n
+                            tq.reset(total=total)
+                            overrides = _TQDM_TYPE_KWARGS.get((self.display_type, True))
+                            if overrides:
+                                tq.bar_format = overrides["bar_format"]
+                            tq.n = old_n
+                            tq.refresh()
                         else:
-                            self._tqdm.total = total
-                            self._tqdm.refresh()
+                            tq.total = total
+                            tq.refresh()
                     except Exception as e:
                         self.logger.debug(f"Error updating tqdm total: {e}")
-                        # Fallback: recreate tqdm
-                        try:
-                            old_desc = self._tqdm.desc if self._tqdm else self.title
-                            old_n = self._tqdm.n if self._tqdm else 0
-                            if self._tqdm:
-                                self._tqdm.close()
-                            self._create_tqdm()
-                            if self._tqdm:
-                                self._tqdm.n = old_n
-                                self._tqdm.set_description(old_desc)
-                                self._tqdm.refresh()
-                        except Exception as e2:
-                            self.logger.debug(f"Failed to recreate tqdm: {e2}")
+                        recreate = True
+
+            if recreate:
+                # Fallback: recreate tqdm (outside the lock, which
+                # _create_tqdm acquires itself)
+                try:
+                    with self._tqdm_lock:
+                        old_tq = self._tqdm
+                        self._tqdm = None
+                    old_desc = old_tq.desc if old_tq else self.title
+                    old_n = old_tq.n if old_tq else 0
+                    if old_tq:
+                        old_tq.close()
+                    self._create_tqdm()
+                    with self._tqdm_lock:
+                        if self._tqdm:
+                            self._tqdm.n = old_n
+                            self._tqdm.set_description(old_desc)
+                            self._last_desc = ""
+                            self._tqdm.refresh()
+                except Exception as e2:
+                    self.logger.debug(f"Failed to recreate tqdm: {e2}")
 
         # Update message
         if message is not None:
@@ -119,16 +215,19 @@ class _ProgressDisplay:
 
         # Update tqdm display
         with self._tqdm_lock:
-            if self._tqdm is not None:
+            tq = self._tqdm
+            set_desc = self._tq_set_desc
+            refresh = self._tq_refresh
+            if tq is not None and set_desc is not None and refresh is not None:
                 try:
-                    self._tqdm.n = progress
+                    tq.n = progress
 
-                    if self.message:
-                        self._tqdm.set_description(f"{self.title} - {self.message}")
-                    else:
-                        self._tqdm.set_description(self.title)
+                    desc = f"{self.title} - {self.message}" if self.message else self.title
+                    if desc != self._last_desc:
+                        set_desc(desc, refresh=False)
+                        self._last_desc = desc
 
-                    self._tqdm.refresh()
+                    refresh()
                 except Exception as e:
                     self.logger.debug(f"Error updating tqdm: {e}")
 
@@ -145,109 +244,62 @@ class _ProgressDisplay:
         with self._tqdm_lock:
             if self._tqdm is not None:
                 try:
-                    # Always clear progress bars cleanly without leaving any output
+                    # Always clear progress bars cleanly without leaving any output;
+                    # the owning manager clears remaining line artifacts once
                     self._tqdm.clear()
                     self._tqdm.close()
-
-                    # Clear any remaining line artifacts
-                    sys.stderr.write("\r\033[K")
-                    sys.stderr.flush()
-
                 except Exception as e:
                     self.logger.debug(f"Error completing tqdm: {e}")
                 finally:
                     self._tqdm = None
+                    self._tq_set_desc = None
+                    self._tq_refresh = None
 
     def _create_tqdm(self) -> None:
         """Create the tqdm instance based on display type."""
         try:
-            tqdm_kwargs = {
-                "desc": self.title,
-                "leave": False,
-                "unit": "items",
-                "file": sys.stderr,
-                "disable": False,
-                "dynamic_ncols": True,
-                "ascii": False,
-                "mininterval": 0.1,
-                "maxinterval": 1.0,
-                "smoothing": 0.1,
-                "position": None,
-                "ncols": 70,
-                "colour": None,
-            }
+            determinate = bool(self.total)
+            tqdm_kwargs = _TQDM_BASE_KWARGS | _TQDM_TYPE_KWARGS.get(
+                (self.display_type, determinate), {}
+            )
+            tqdm_kwargs["desc"] = self.title
+            tqdm_kwargs["file"] = sys.stderr
 
             # Handle total
             if self.total is not None and self.total > 0:
                 tqdm_kwargs["total"] = self.total
 
-            # Configure based on display type
-            if self.display_type == DisplayType.SIMPLE:
-                tqdm_kwargs.update(
-                    {
-                        "bar_format": "{desc}: {n} items",
-                        "ncols": 60,
-                    }
-                )
-            elif self.display_type == DisplayType.PROGRESS_BAR:
-                if self.total:
-                    tqdm_kwargs.update(
-                        {
-                            "bar_format": "{desc}: {percentage:3.0f}%|{bar}| "
-                            "{n}/{total} [{elapsed}<{remaining}]",
-                            "ncols": 80,
-                        }
-                    )
-                else:
-                    tqdm_kwargs.update(
-                        {
-                            "bar_format": "{desc} [{elapsed}]",
-                            "ncols": 60,
-                        }
-                    )
-            elif self.display_type == DisplayType.SPINNER:
-                tqdm_kwargs.update(
-                    {
-                        "bar_format": "{desc}: {n} items [{elapsed}]",
-                        "ncols": 60,
-                    }
-                )
-            elif self.display_type == DisplayType.DETAILED:
-                if self.total:
-                    tqdm_kwargs.update(
-                        {
-                            "bar_format": "{desc}: {percentage:3.0f}%|{bar}| "
-                            "{n}/{total} [{elapsed}<{remaining}, {rate_fmt}]",
-                            "ncols": 100,
-                            "unit_scale": True,
-                        }
-                    )
-                else:
-                    tqdm_kwargs.update(
-                        {
-                            "bar_format": "{desc}: {n} items [{elapsed}, {rate_fmt}]",
-                            "ncols": 80,
-                            "unit_scale": True,
-                        }
-                    )
+            tqdm_cls = _ProgressDisplay._tqdm_cls
+            if tqdm_cls is None:
+                from tqdm import tqdm as _tqdm
+
+                tqdm_cls = _ProgressDisplay._tqdm_cls = _tqdm
 
             with self._tqdm_lock:
                 # Provide an empty iterable as the first argument to tqdm
 
                 # Ignore type errors since tqdm's type hints are complex and difficult to match exactly
-                self._tqdm = tqdm(iter([]), **tqdm_kwargs)  # type: ignore
+                self._tqdm = tqdm_cls(iter([]), **tqdm_kwargs)  # type: ignore
+                self._tq_set_desc = self._tqdm.set_description
+                self._last_desc = self.title
+                self._tq_refresh = self._tqdm.refresh
 
                 if self.message:
-                    self._tqdm.set_description(f"{self.title} - {self.message}")
+                    self._last_desc = f"{self.title} - {self.message}"
+                    self._tqdm.set_description(self._last_desc)
 
         except Exception as e:
             self.logger.debug(f"Error creating tqdm: {e}")
             self._tqdm = None
+            self._tq_set_desc = None
+            self._tq_refresh = None
 
 
 class _MockProgress(_ProgressDisplay):
     """Mock progress display for when system is shutting down."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.is_visible = False
         self.is_completed = False
@@ -262,3 +314,7 @@ class _MockProgress(_ProgressDisplay):
 
     def complete(self, final_message: Optional[str] = None) -> None:
         pass
+
+
+# Stateless, so a single shared instance serves every post-shutdown request
+_MOCK_PROGRESS = _MockProgress()
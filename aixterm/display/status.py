@@ -1,15 +1,54 @@
 """Status message functionality for the display system."""
 
-from typing import Any
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from ..utils import get_logger
 from ..config_env.env_vars import get_show_timing
 from .types import MessageType
 
+# Buffered status output is written out once it grows past this many bytes
+_FLUSH_THRESHOLD = 4096
+
+# (upper bound in seconds, multiplier, format) for elapsed time display
+_ELAPSED_FORMATS = (
+    (0.1, 1000, "{:.0f}ms"),
+    (1, 1000, "{:.1f}ms"),
+    (60, 1, "{:.2f}s"),
+)
+
+# AIXTERM_SHOW_TIMING, resolved once per process
+_show_timing = get_show_timing()
+
+
+def refresh_timing_flag() -> bool:
+    """Re-read AIXTERM_SHOW_TIMING after the environment has changed.
+
+    Returns:
+        The updated flag value
+    """
+    global _show_timing
+    _show_timing = get_show_timing()
+    return _show_timing
+
 
 class StatusDisplay:
     """Handles status and error messages in the terminal."""
 
+    # Message prefixes per type; unlisted types are shown without a prefix
+    _PREFIX = {
+        MessageType.ERROR: "Error: ",
+        MessageType.WARNING: "Warning: ",
+        MessageType.SUCCESS: "",
+        MessageType.TOOL_CALL: "",  # No prefix for tool calls
+        MessageType.INFO: "",
+    }
+    _PREFIX_BYTES = {k: v.encode() for k, v in _PREFIX.items()}
+
+    # Message types that are written out immediately even inside a batch
+    _URGENT = frozenset((MessageType.ERROR, MessageType.WARNING))
+
     def __init__(self, parent_manager: Any):  # Use Any to avoid circular imports
         """Initialize status display.
 
@@ -19,6 +58,68 @@ class StatusDisplay:
         self.logger = get_logger(__name__)
         self._parent = parent_manager
 
+        # Encoded messages pending output while a batch is open
+        self._buf = bytearray()
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer status messages and write them out together on exit.
+
+        Errors and warnings are still written immediately.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered status messages."""
+        if not self._buf:
+            return
+        stream = sys.stdout
+        raw = getattr(stream, "buffer", None)
+        try:
+            if raw is None:
+                stream.write(self._buf.decode("utf-8", "replace"))
+                stream.flush()
+            else:
+                # Drain pending text-layer output first to keep ordering
+                stream.flush()
+                raw.write(self._buf)
+                raw.flush()
+        finally:
+            self._buf.clear()
+
+    def _write_line(self, text: str, msg_type: MessageType = MessageType.INFO) -> None:
+        """Queue a line of status output, flushing unless batching.
+
+        Args:
+            text: Line to write (without prefix or trailing newline)
+            msg_type: Type of message, selects the prefix and flush urgency
+        """
+        raw = getattr(sys.stdout, "buffer", None)
+        if raw is None:
+            # Text-only stream (e.g. redirected to StringIO); no byte buffering
+            self.flush()
+            sys.stdout.write(f"{self._PREFIX.get(msg_type, '')}{text}\n")
+            return
+
+        encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        buf = self._buf
+        buf += self._PREFIX_BYTES.get(msg_type, b"")
+        buf += text.encode(encoding, "replace")
+        buf += b"\n"
+        if (
+            msg_type in self._URGENT
+            or not self._batch_depth
+            or len(buf) > _FLUSH_THRESHOLD
+        ):
+            self.flush()
+
     def show_message(
         self,
         message: str,
@@ -36,19 +137,8 @@ class StatusDisplay:
         if clear_progress and self._parent._active_progress:
             self._parent.clear_all_progress()
 
-        # Format message based on type
-        if msg_type == MessageType.ERROR:
-            formatted = f"Error: {message}"
-        elif msg_type == MessageType.WARNING:
-            formatted = f"Warning: {message}"
-        elif msg_type == MessageType.SUCCESS:
-            formatted = message
-        elif msg_type == MessageType.TOOL_CALL:
-            formatted = message  # No prefix for tool calls
-        else:  # INFO
-            formatted = message
-
-        print(formatted)
+        # Prefix is looked up from the per-type table while writing
+        self._write_line(message, msg_type)
 
     def show_info(self, message: str, clear_progress: bool = True) -> None:
         """Show an information message."""
@@ -76,24 +166,23 @@ class StatusDisplay:
         Args:
             seconds: Time in seconds
         """
-        # Suppressed by default to keep CLI output clean.
-        # If desired in the future, re-enable via config/env flag.
+        # Suppressed by default to keep CLI output clean; opt in via
+        # AIXTERM_SHOW_TIMING (read once, see refresh_timing_flag)
+        if not _show_timing:
+            return
         try:
-            if get_show_timing():  # optional opt-in
-                # Format time nicely
-                if seconds < 0.1:
-                    time_str = f"{seconds * 1000:.0f}ms"
-                elif seconds < 1:
-                    time_str = f"{seconds * 1000:.1f}ms"
-                elif seconds < 60:
-                    time_str = f"{seconds:.2f}s"
-                else:
-                    minutes = int(seconds / 60)
-                    remaining_seconds = seconds % 60
-                    time_str = f"{minutes}m {remaining_seconds:.1f}s"
-
-                formatted = f"[Completed in {time_str}]"
-                print(formatted)
+            # Format time nicely
+            for limit, scale, fmt in _ELAPSED_FORMATS:
+                if seconds < limit:
+                    time_str = fmt.format(seconds * scale)
+                    break
+            else:
+                minutes = int(seconds / 60)
+                remaining_seconds = seconds % 60
+                time_str = f"{minutes}m {remaining_seconds:.1f}s"
+
+            formatted = f"[Completed in {time_str}]"
+            self._write_line(formatted)
         except Exception:
             # Fail closed (silent) on any unexpected error
             pass
@@ -6,6 +6,12 @@ from typing import Any
 
 from ..utils import get_logger
 
+# Carriage return + erase entire line
+_CLEAR_LINE = b"\r\x1b[2K"
+
+# Minimum spacing between line clears
+_MIN_CLEAR_INTERVAL_NS = 100_000_000
+
 
 class TerminalController:
     """Handles terminal control operations."""
@@ -18,12 +24,17 @@ class TerminalController:
         """
         self.logger = get_logger(__name__)
         self._parent = parent_manager
-        self._last_clear_time = 0.0
+        self._last_clear_ns = 0
 
     def clear_terminal_line(self) -> None:
         """Clear the current terminal line."""
-        current_time = time.time()
-        if current_time - self._last_clear_time > 0.1:  # Rate limit
-            sys.stderr.write("\r\033[2K")  # Clear entire line
-            sys.stderr.flush()
-            self._last_clear_time = current_time
+        current_ns = time.monotonic_ns()
+        if current_ns - self._last_clear_ns > _MIN_CLEAR_INTERVAL_NS:  # Rate limit
+            raw = getattr(sys.stderr, "buffer", None)
+            if raw is not None:
+                raw.write(_CLEAR_LINE)
+                raw.flush()
+            else:
+                sys.stderr.write(_CLEAR_LINE.decode("ascii"))
+                sys.stderr.flush()
+            self._last_clear_ns = current_ns
@@ -1,6 +1,6 @@
 """Display types and enumerations."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class DisplayType(Enum):
@@ -12,11 +12,11 @@ class DisplayType(Enum):
     DETAILED = "detailed"  # Detailed with estimates
 
 
-class MessageType(Enum):
+class MessageType(IntEnum):
     """Types of status messages."""
 
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
-    SUCCESS = "success"
-    TOOL_CALL = "tool_call"
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    SUCCESS = 3
+    TOOL_CALL = 4
@@ -1,11 +1,15 @@
 """Shell integration modules for terminal logging and context capture."""
 
-from typing import Dict, Optional, Type
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
 from .base import BaseIntegration
-from .bash import Bash
-from .fish import Fish
-from .zsh import Zsh
+
+if TYPE_CHECKING:
+    from .bash import Bash
+    from .fish import Fish
+    from .zsh import Zsh
 
 __all__ = [
     "BaseIntegration",
@@ -15,14 +19,61 @@ __all__ = [
     "get_shell_integration_manager",
 ]
 
-# Shell integration mapping
-_SHELL_INTEGRATIONS: Dict[str, Type[BaseIntegration]] = {
-    "bash": Bash,
-    "fish": Fish,
-    "zsh": Zsh,
+# Shell integration mapping: shell name -> (module, class name). Submodules are
+# imported on first use so that only the requested shell's module gets loaded.
+_SHELL_INTEGRATIONS: Dict[str, Tuple[str, str]] = {
+    "bash": ("aixterm.integration.bash", "Bash"),
+    "fish": ("aixterm.integration.fish", "Fish"),
+    "zsh": ("aixterm.integration.zsh", "Zsh"),
+}
+
+_LAZY_CLASSES: Dict[str, Tuple[str, str]] = {
+    class_name: (module_name, class_name)
+    for module_name, class_name in _SHELL_INTEGRATIONS.values()
 }
 
 
+def _load_integration_class(module_name: str, class_name: str) -> Type[BaseIntegration]:
+    """Import an integration submodule and return its class."""
+    integration_class: Type[BaseIntegration] = getattr(
+        importlib.import_module(module_name), class_name
+    )
+    return integration_class
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the shell integration classes (PEP 562)."""
+    target = _LAZY_CLASSES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    integration_class = _load_integration_class(*target)
+    globals()[name] = integration_class
+    return integration_class
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_integration_class(shell_name: str) -> Optional[Type[BaseIntegration]]:
+    """Map a raw shell name or executable path to its integration class.
+
+    Args:
+        shell_name: Shell name or path as given by the caller
+
+    Returns:
+        Integration class or None if not supported
+    """
+    # Handle common shell executable patterns: take the basename of a path
+    shell_name = shell_name.lower().rpartition("/")[2].rpartition("\\")[2]
+
+    # Remove file extension if present
+    shell_name = shell_name.partition(".")[0]
+
+    # Try to match shell, importing only the requested integration module
+    target = _SHELL_INTEGRATIONS.get(shell_name)
+    if target is None:
+        return None
+    return _load_integration_class(*target)
+
+
 def get_shell_integration_manager(shell_name: str) -> Optional[BaseIntegration]:
     """Get shell integration manager for the given shell name.
 
@@ -32,20 +83,7 @@ def get_shell_integration_manager(shell_name: str) -> Optional[BaseIntegration]:
     Returns:
         Shell integration manager or None if not supported
     """
-    # Handle common shell executable patterns
-    shell_name = shell_name.lower()
-    if "/" in shell_name or "\\" in shell_name:
-        # Extract basename from path
-        import os
-
-        shell_name = os.path.basename(shell_name)
-
-    # Remove file extension if present
-    if "." in shell_name:
-        shell_name = shell_name.split(".")[0]
-
-    # Try to match shell
-    integration_class = _SHELL_INTEGRATIONS.get(shell_name)
+    integration_class = _resolve_integration_class(shell_name)
     if integration_class:
         # Integration classes use optional logger; construct without arguments
         return integration_class()
@@ -1,30 +1,152 @@
 """Base class for shell integrations."""
 
+import functools
+import logging
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils import get_logger
 
+# Shared default logger for integrations constructed without one
+_default_logger: Optional[logging.Logger] = None
+
+
+def _get_default_logger() -> logging.Logger:
+    """Return the module logger, configuring it on first use only."""
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = get_logger(__name__)
+    return _default_logger
+
+
+# User home directory, resolved on first use (see _get_home)
+_HOME: Optional[Path] = None
+
+
+def _get_home() -> Path:
+    """Return the user's home directory, cached after the first lookup.
+
+    Tests patch this function rather than ``Path.home``.
+    """
+    global _HOME
+    if _HOME is None:
+        _HOME = Path.home()
+    return _HOME
+
+
+# is_integration_installed results per (config file, shell), validated by the
+# file's (inode, size, mtime_ns). Module-level so that the fresh integration
+# objects built for each status request share it.
+_INSTALL_CACHE: Dict[Tuple[Path, str], Tuple[Tuple[int, int, int], bool]] = {}
+
+# First line of every integration script and of the sourcing block
+_INTEGRATION_MARKER = "# AIxTerm Shell Integration"
+
+# Sourcing block appended to user config files (POSIX-style shells)
+_SNIPPET_TMPL = (
+    "\n{marker}\n"
+    "# Source AIxTerm {shell} integration rc file\n"
+    'AIXTERM_RC="$HOME/.aixterm/{name}"\n'
+    'if [ -f "$AIXTERM_RC" ]; then\n'
+    '    . "$AIXTERM_RC"\n'
+    "fi\n"
+)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temp file and ``os.replace``.
+
+    A crash mid-write leaves the original file intact. Symlinked config files
+    are followed so the link itself is preserved, and an existing file keeps
+    its permission bits.
+    """
+    target = Path(os.path.realpath(path))
+    tmp = target.with_suffix(target.suffix + ".aixterm_tmp")
+    try:
+        mode = target.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o644
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Whitespace-only lines at the end of a config file
+_TRAILING_BLANK_LINES_RE = re.compile(r"(?:\n[^\S\n]*)*\Z")
+
+
+@functools.lru_cache(maxsize=8)
+def _removal_pattern(marker: str, rc_ref: str, block_end: str) -> "re.Pattern[str]":
+    """Compile the regex matching AIxTerm sourcing blocks in a user config.
+
+    A block starts at a line beginning with the integration marker or the
+    legacy ``AIXTERM_RC=`` assignment, or at any non-comment line referencing
+    the rc file. It runs through the first line equal to ``block_end`` (or to
+    the end of the file) plus any blank lines directly after it. Stand-alone
+    ``# Source AIxTerm`` comment lines are matched as well.
+    """
+    ws = r"[^\S\n]*"
+    legacy = re.escape('AIXTERM_RC="$HOME/.aixterm/')
+    start = (
+        rf"{ws}(?:{re.escape(marker)}|{legacy})"
+        rf"|(?!{ws}#)[^\n]*?{re.escape(rc_ref)}"
+    )
+    end_line = rf"{ws}{re.escape(block_end)}{ws}(?:\n|\Z)"
+    block = (
+        rf"^(?:{start})[^\n]*(?:\n|\Z)"
+        rf"(?:(?:[^\n]*\n)*?{end_line}|[\s\S]*\Z)"
+        rf"(?:{ws}\n)*"
+    )
+    comment = rf"^{ws}# Source AIxTerm [^\n]*(?:\n|\Z)"
+    return re.compile(f"{block}|{comment}", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_source_snippet(marker: str, shell: str, name: str) -> str:
+    """Render the sourcing snippet; cached per (marker, shell, rc file name)."""
+    return _SNIPPET_TMPL.format(marker=marker, shell=shell, name=name)
+
 
 class BaseIntegration(ABC):
     """Base class for shell integration implementations."""
 
+    # Line that closes the sourcing snippet's conditional block
+    _snippet_block_end = "fi"
+
     def __init__(self, logger: Any | None = None) -> None:
         """Initialize the integration.
 
         Args:
             logger: Logger instance
         """
-        # Use centralized logger utility when no logger is provided
-        if logger is None:
-            self.logger = get_logger(__name__)
-        else:
-            self.logger = logger
-        self.integration_marker = "# AIxTerm Shell Integration"
+        # Use the shared centralized logger when no logger is provided
+        self.logger = logger if logger is not None else _get_default_logger()
+        self.integration_marker = _INTEGRATION_MARKER
+        # Resolved config paths; cleared by install()/uninstall()
+        self._config_paths: Optional[List[Path]] = None
+        self._cached_config_file: Optional[Path] = None
+        # (available, first line of --version output); see _probe_shell()
+        self._version_cache: Optional[Tuple[bool, Optional[str]]] = None
 
     @property
     @abstractmethod
@@ -58,13 +180,29 @@ class BaseIntegration(ABC):
         Default implementation checks if shell command exists and responds to --version.
         Subclasses can override for shell-specific behavior.
         """
-        try:
-            result = subprocess.run(
-                [self.shell_name, "--version"], capture_output=True, text=True, timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self._probe_shell()[0]
+
+    def _probe_shell(self) -> Tuple[bool, Optional[str]]:
+        """Run ``<shell> --version`` once and cache availability and version.
+
+        Returns:
+            Tuple of (shell responded successfully, stripped first output line)
+        """
+        if self._version_cache is None:
+            try:
+                # Only stdout is needed: skip the stderr pipe and text decoding
+                output = subprocess.check_output(
+                    [self.shell_name, "--version"],
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                )
+                # Extract version from first line
+                first_line = output.split(b"\n", 1)[0]
+                self._version_cache = (True, first_line.decode(errors="replace").strip())
+            except Exception:
+                # Missing shell, non-zero exit (CalledProcessError) or timeout
+                self._version_cache = (False, None)
+        return self._version_cache
 
     def validate_integration_environment(self) -> bool:
         """Validate that the environment is suitable for integration.
@@ -76,20 +214,14 @@ class BaseIntegration(ABC):
         Subclasses can override to add shell-specific validations.
         """
         try:
-            # Check if we can detect TTY
-            tty_result = os.system("tty >/dev/null 2>&1")
-            if tty_result != 0:
+            # Check if we can detect TTY: same test as tty(1) on stdin, without
+            # spawning /bin/sh and tty
+            if not os.isatty(0):
                 return False
 
-            # Check if we can write to home directory
-            home = Path.home()
-            test_file = home / ".aixterm_test"
-            try:
-                test_file.write_text("test")
-                test_file.unlink()
-                return True
-            except Exception:
-                return False
+            # Check if we can write to home directory (permission check only,
+            # no probe file to create and unlink)
+            return os.access(_get_home(), os.W_OK)
         except Exception:
             return False
 
@@ -99,17 +231,7 @@ class BaseIntegration(ABC):
         Default implementation calls shell --version and returns first line.
         Subclasses can override for shell-specific version detection.
         """
-        try:
-            result = subprocess.run(
-                [self.shell_name, "--version"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                # Extract version from first line
-                first_line = result.stdout.split("\n")[0]
-                return first_line.strip()
-            return None
-        except Exception:
-            return None
+        return self._probe_shell()[1]
 
     @abstractmethod
     def get_installation_notes(self) -> List[str]:
@@ -127,20 +249,34 @@ class BaseIntegration(ABC):
         Returns:
             Path to config file to use
         """
-        home = Path.home()
-
-        # Find existing config file
-        for config_name in self.config_files:
-            config_path = home / config_name
-            if config_path.exists():
-                self.logger.debug(f"Found existing config file: {config_path}")
-                return config_path
-
-        # Return path for first config file (will be created)
-        config_path = home / self.config_files[0]
-        self.logger.debug(f"Using config file: {config_path}")
+        if self._cached_config_file is not None:
+            return self._cached_config_file
+
+        paths = self._get_config_paths()
+
+        # Find existing config file, else use the first one (will be created)
+        config_path = next((p for p in paths if p.exists()), None)
+        if config_path is not None:
+            self.logger.debug(f"Found existing config file: {config_path}")
+        else:
+            config_path = paths[0]
+            self.logger.debug(f"Using config file: {config_path}")
+
+        self._cached_config_file = config_path
         return config_path
 
+    def _get_config_paths(self) -> List[Path]:
+        """Return absolute candidate config paths, resolved once per instance."""
+        if self._config_paths is None:
+            home = _get_home()
+            self._config_paths = [home / name for name in self.config_files]
+        return self._config_paths
+
+    def _invalidate_config_cache(self) -> None:
+        """Forget resolved config paths so the next lookup re-checks the disk."""
+        self._config_paths = None
+        self._cached_config_file = None
+
     def get_selected_config_file(self) -> Optional[Path]:
         """Get the selected configuration file path.
 
@@ -150,16 +286,73 @@ class BaseIntegration(ABC):
         return self.find_config_file()
 
     def is_integration_installed(self, config_file: Path) -> bool:
-        """Return True if user config contains a source line for rc file."""
-        if not config_file.exists():
+        """Return True if user config contains a source line for rc file.
+
+        The result is cached per file and shell, across instances, and reused
+        while the file's inode, size and modification time are unchanged, so
+        repeated status polls cost a single ``stat()`` instead of a full read.
+        That ``stat()`` also answers existence and size for the scan.
+        """
+        cache_key = (config_file, self.shell_name)
+        try:
+            st = config_file.stat()
+        except FileNotFoundError:
+            _INSTALL_CACHE.pop(cache_key, None)
+            return False
+        except OSError:
+            _INSTALL_CACHE.pop(cache_key, None)
+            return self._config_has_source_line(config_file)
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = _INSTALL_CACHE.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        installed = self._config_has_source_line(config_file, st.st_size)
+        _INSTALL_CACHE[cache_key] = (key, installed)
+        return installed
+
+    def _config_has_source_line(self, config_file: Path, size: Optional[int] = None) -> bool:
+        """Scan a config file for the rc source line without decoding it.
+
+        The file is memory-mapped and searched as bytes; files that cannot be
+        mapped (pipes, special files) fall back to a normal text read.
+
+        Args:
+            config_file: Config file to scan
+            size: File size from a ``stat()`` the caller already made, if any
+        """
+        if size == 0:
             return False
+        needle = f".aixterm/{self.shell_name}.rc".encode()
         try:
-            content = config_file.read_text()
-            rc_ref = f".aixterm/{self.shell_name}.rc"
-            return rc_ref in content
-        except Exception as e:  # pragma: no cover - defensive
+            fd = os.open(config_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
             self.logger.error(f"Error checking integration status: {e}")
             return False
+        try:
+            if size is None and os.fstat(fd).st_size == 0:
+                return False
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+        except (OSError, ValueError):
+            return self._installed_in_text(self._read_config_text(config_file))
+        finally:
+            os.close(fd)
+
+    def _read_config_text(self, config_file: Path) -> str:
+        """Read a user config file, returning "" if missing or unreadable."""
+        try:
+            return config_file.read_text()
+        except FileNotFoundError:
+            return ""
+        except Exception as e:  # pragma: no cover - defensive
+            self.logger.error(f"Error checking integration status: {e}")
+            return ""
+
+    def _installed_in_text(self, text: str) -> bool:
+        """Return True if config text contains a source line for rc file."""
+        return f".aixterm/{self.shell_name}.rc" in text
 
     def install(self, force: bool = False, interactive: bool = True) -> bool:
         """Install integration using standalone rc file under ~/.aixterm.
@@ -171,6 +364,7 @@ class BaseIntegration(ABC):
         """
         print(f"Installing AIxTerm {self.shell_name} integration (rc mode)...")
 
+        self._invalidate_config_cache()
         config_file = self.find_config_file()
         if not config_file:
             print(f"Error: Could not determine {self.shell_name} config file location")
@@ -183,7 +377,7 @@ class BaseIntegration(ABC):
             return False
 
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        rc_dir = Path.home() / ".aixterm"
+        rc_dir = _get_home() / ".aixterm"
         try:
             if not rc_dir.exists():
                 rc_dir.mkdir(parents=True, exist_ok=False)
@@ -203,7 +397,9 @@ class BaseIntegration(ABC):
                 print(f"Error writing rc file: {e}")
                 return False
 
-        installed = self.is_integration_installed(config_file)
+        # Read the user config once for both the installed and duplicate checks
+        config_text = self._read_config_text(config_file)
+        installed = self._installed_in_text(config_text)
         if installed and not force:
             print(f" Integration already installed in {config_file}")
             return True
@@ -214,28 +410,18 @@ class BaseIntegration(ABC):
 
         # If force reinstall, remove existing snippet after backup so user can recover
         if force:
-            self._remove_existing_integration(config_file)
+            self._remove_existing_integration(config_file, config_text)
 
-        snippet = self._get_source_snippet(rc_file)
-        # Ensure config file exists before reading
-        if not config_file.exists():
-            try:
-                config_file.touch()
-            except Exception as e:  # pragma: no cover
-                print(f"Error creating shell config file: {e}")
-                return False
-        if not force:
-            try:
-                # Re-check after potential backup to avoid duplicate snippet
-                if f".aixterm/{self.shell_name}.rc" in config_file.read_text():
-                    return True
-            except Exception:  # pragma: no cover
-                pass
+        buf = self._get_source_snippet(rc_file).encode()
+        if not buf.endswith(b"\n"):
+            buf += b"\n"
         try:
-            with open(config_file, "a") as f:
-                if not snippet.endswith("\n"):
-                    snippet += "\n"
-                f.write(snippet)
+            # Single O_APPEND write; creates the config file if missing
+            fd = os.open(config_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
             print(f" Added sourcing snippet to {config_file}")
         except Exception as e:  # pragma: no cover - defensive
             print(f"Error updating shell config: {e}")
@@ -246,14 +432,7 @@ class BaseIntegration(ABC):
 
     def _get_source_snippet(self, rc_file: Path) -> str:
         """Return snippet inserted into user config to source rc file."""
-        return (
-            f"\n{self.integration_marker}\n"
-            f"# Source AIxTerm {self.shell_name} integration rc file\n"
-            f'AIXTERM_RC="$HOME/.aixterm/{rc_file.name}"\n'
-            f'if [ -f "$AIXTERM_RC" ]; then\n'
-            f'    . "$AIXTERM_RC"\n'
-            f"fi\n"
-        )
+        return _build_source_snippet(self.integration_marker, self.shell_name, rc_file.name)
 
     def uninstall(self) -> bool:
         """Uninstall the shell integration.
@@ -267,20 +446,20 @@ class BaseIntegration(ABC):
         config_files_to_check = []
 
         # Try to find the primary config file first
+        self._invalidate_config_cache()
         primary_config = self.find_config_file()
         if primary_config and primary_config.exists():
             config_files_to_check.append(primary_config)
         else:
             # Fall back to checking all potential config files in home directory
-            home = Path.home()
-            for config_name in self.config_files:
-                config_file = home / config_name
-                if config_file.exists():
-                    config_files_to_check.append(config_file)
+            config_files_to_check.extend(
+                p for p in self._get_config_paths() if p.exists()
+            )
 
         for config_file in config_files_to_check:
-            if self.is_integration_installed(config_file):
-                if self._remove_existing_integration(config_file):
+            config_text = self._read_config_text(config_file)
+            if self._installed_in_text(config_text):
+                if self._remove_existing_integration(config_file, config_text):
                     print(f" Removed integration from: {config_file}")
                 else:
                     print(f"Error: Failed to remove integration from {config_file}")
@@ -304,63 +483,43 @@ class BaseIntegration(ABC):
             backup_file = config_file.with_suffix(
                 config_file.suffix + f".aixterm_backup_{int(time.time())}"
             )
-            backup_file.write_text(config_file.read_text())
+            tmp = backup_file.with_name(backup_file.name + ".aixterm_tmp")
+            try:
+                shutil.copyfile(config_file, tmp)
+                os.replace(tmp, backup_file)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
             print(f" Backup created: {backup_file}")
             return True
         except Exception as e:
             self.logger.error(f"Error creating backup: {e}")
             return False
 
-    def _remove_existing_integration(self, config_file: Path) -> bool:
-        """Remove previously added sourcing snippet from user config."""
+    def _remove_existing_integration(
+        self, config_file: Path, content: Optional[str] = None
+    ) -> bool:
+        """Remove previously added sourcing snippet from user config.
+
+        Args:
+            config_file: Path to config file
+            content: Current config text, if the caller has already read it
+        """
         try:
             if not config_file.exists():
                 return True
-            lines = config_file.read_text().splitlines()
-            rc_ref = f".aixterm/{self.shell_name}.rc"
-            filtered: list[str] = []
-            i = 0
-            total = len(lines)
-            while i < total:
-                line = lines[i]
-                # Primary (current) snippet starts with integration marker
-                if self.integration_marker in line:
-                    j = i + 1
-                    # Advance until we find closing 'fi' of the snippet block
-                    while j < total and lines[j].strip() != "fi":
-                        j += 1
-                    if j < total and lines[j].strip() == "fi":
-                        j += 1  # include fi
-                    # Skip trailing blank lines directly following the block
-                    while j < total and lines[j].strip() == "":
-                        j += 1
-                    i = j
-                    continue
-                # Old snippet patterns that might lack variable or marker handling
-                if rc_ref in line or 'AIXTERM_RC="$HOME/.aixterm/' in line:
-                    # Attempt to skip an enclosing if block if present (line may be 'if [ -f ...')
-                    j = i + 1
-                    while j < total and lines[j].strip() != "fi":
-                        j += 1
-                    if j < total and lines[j].strip() == "fi":
-                        j += 1
-                    while j < total and lines[j].strip() == "":
-                        j += 1
-                    i = j
-                    continue
-                # Fallback old source comment line
-                if line.startswith("# Source AIxTerm "):
-                    i += 1
-                    continue
-                filtered.append(line)
-                i += 1
-            # Trim trailing blank lines
-            while filtered and filtered[-1].strip() == "":
-                filtered.pop()
-            new_content = "\n".join(filtered)
-            if new_content:
-                new_content += "\n"
-            config_file.write_text(new_content)
+            if content is None:
+                content = config_file.read_text()
+            pattern = _removal_pattern(
+                self.integration_marker,
+                f".aixterm/{self.shell_name}.rc",
+                self._snippet_block_end,
+            )
+            # Scan and cut every block in one C-level pass, then trim trailing
+            # blank lines
+            new_content = _TRAILING_BLANK_LINES_RE.sub("", pattern.sub("", content))
+            new_content = new_content + "\n" if new_content.strip() else ""
+            _atomic_write_bytes(config_file, new_content.encode())
             return True
         except Exception as e:  # pragma: no cover - defensive
             self.logger.error(f"Error removing existing integration: {e}")
@@ -4,35 +4,11 @@ import os
 from pathlib import Path
 from typing import List, Optional
 
-from .base import BaseIntegration
+from .base import _INTEGRATION_MARKER, BaseIntegration
 
 
-class Bash(BaseIntegration):
-    """Bash shell integration handler.
-    
-    Uses default implementations from BaseIntegration for is_available(),
-    validate_integration_environment(), and get_current_shell_version().
-    """
-
-    def __init__(self) -> None:
-        """Initialize bash integration."""
-        super().__init__()
-
-    @property
-    def shell_name(self) -> str:
-        """Return the shell name."""
-        return "bash"
-
-    @property
-    def config_files(self) -> List[str]:
-        """Return list of potential bash config files."""
-        return [".bashrc", ".bash_profile"]
-
-    def generate_integration_code(self) -> str:
-        """Return the simplified bash integration script that uses script for
-        full terminal logging."""
-        return """
-# AIxTerm Shell Integration - Simplified Script-Based Logger
+# Integration script sourced from ~/.aixterm/bash.rc; built once at import
+_BASH_SCRIPT = "\n" + _INTEGRATION_MARKER + r""" - Simplified Script-Based Logger
 # Logs complete terminal sessions using the script command
 
 # Only run if we're in an interactive shell
@@ -44,37 +20,44 @@ if [[ -n "$_AIXTERM_LOADED" ]] && [[ -z "$_AIXTERM_IN_SCRIPT" ]]; then
     return
 fi
 
+# Resolve the TTY and its log file once at load time so later calls don't fork
+_AIXTERM_TTY="$(tty 2>/dev/null)"
+_AIXTERM_TTY_NAME="${_AIXTERM_TTY//\/dev\//}"
+_AIXTERM_TTY_NAME="${_AIXTERM_TTY_NAME//\//-}"
+# Use original TTY if available, otherwise current TTY
+_AIXTERM_TTY_LOG_FILE="$HOME/.aixterm/tty/${_AIXTERM_ORIGINAL_TTY:-${_AIXTERM_TTY_NAME:-default}}.log"
+
+# Store the current time, formatted like date(1), in the variable named by $1.
+# Bash 4.2+ formats it with the printf builtin; older bash falls back to date.
+if (( BASH_VERSINFO[0] > 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 2) )); then
+    _aixterm_timestamp() { printf -v "$1" '%(%a %b %e %H:%M:%S %Z %Y)T' -1; }
+else
+    _aixterm_timestamp() { printf -v "$1" '%s' "$(date)"; }
+fi
+
 # Get log file based on original TTY, with proper fallback for script sessions
 _aixterm_get_log_file() {
     # If we're in a script session and have the log file set, use that
-    if [[ -n "$_AIXTERM_LOG_FILE" ]]; then
-        echo "$_AIXTERM_LOG_FILE"
-        return
-    fi
-
-    # Use original TTY if available, otherwise current TTY
-    local tty_name
-    if [[ -n "$_AIXTERM_ORIGINAL_TTY" ]]; then
-        tty_name="$_AIXTERM_ORIGINAL_TTY"
-    else
-        tty_name=$(tty 2>/dev/null | sed 's|/dev/||g' | tr '/' '-')
-    fi
-    echo "$HOME/.aixterm/tty/${tty_name:-default}.log"
+    printf '%s\n' "${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
 }
 
 # Show integration status
 aixterm_status() {
     echo "AIxTerm Integration Status:"
     echo "  Shell: bash"
-    echo "  Integration: $(test -n "$_AIXTERM_LOADED" && echo "Active" || echo "Inactive")"
-    echo "  Log file: $(_aixterm_get_log_file)"
-    echo "  Current TTY: $(tty 2>/dev/null || echo 'unknown')"
+    if [[ -n "$_AIXTERM_LOADED" ]]; then
+        echo "  Integration: Active"
+    else
+        echo "  Integration: Inactive"
+    fi
+    echo "  Log file: ${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
+    echo "  Current TTY: ${_AIXTERM_TTY:-unknown}"
 
     if [[ -n "$_AIXTERM_ORIGINAL_TTY" ]]; then
         echo "  Original TTY: $_AIXTERM_ORIGINAL_TTY"
     fi
 
-    local log_file=$(_aixterm_get_log_file)
+    local log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
     if [[ -f "$log_file" ]]; then
         local size=$(du -h "$log_file" 2>/dev/null | cut -f1)
         local lines=$(wc -l < "$log_file" 2>/dev/null)
@@ -105,7 +88,7 @@ aixterm_start_logging() {
         return 1
     fi
 
-    local log_file=$(_aixterm_get_log_file)
+    local log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
 
     if ! command -v script >/dev/null 2>&1; then
         echo "AIxTerm: 'script' command not available"
@@ -116,17 +99,18 @@ aixterm_start_logging() {
     echo "All terminal activity will be captured to: $log_file"
 
     # Add session header
-    {
-        echo "# ========================================"
-        echo "# AIxTerm session started: $(date)"
-        echo "# Original TTY: $(tty 2>/dev/null || echo 'unknown')"
-        echo "# ========================================"
-    } >> "$log_file" 2>/dev/null
+    local timestamp
+    _aixterm_timestamp timestamp
+    printf '%s\n' \
+        "# ========================================" \
+        "# AIxTerm session started: $timestamp" \
+        "# Original TTY: ${_AIXTERM_TTY:-unknown}" \
+        "# ========================================" >> "$log_file" 2>/dev/null
 
     # Start script session with all necessary environment variables
     export _AIXTERM_IN_SCRIPT=1
     export _AIXTERM_LOG_FILE="$log_file"
-    export _AIXTERM_ORIGINAL_TTY="$(tty 2>/dev/null | sed 's|/dev/||g' | tr '/' '-')"
+    export _AIXTERM_ORIGINAL_TTY="$_AIXTERM_TTY_NAME"
     exec script -a -f "$log_file" -c "bash -i"
 }
 
@@ -137,15 +121,16 @@ aixterm_stop_logging() {
         return 1
     fi
 
-    local log_file=$(_aixterm_get_log_file)
+    local log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
 
     # Add session footer
-    {
-        echo ""
-        echo "# ========================================"
-        echo "# AIxTerm session ended: $(date)"
-        echo "# ========================================"
-    } >> "$log_file" 2>/dev/null
+    local timestamp
+    _aixterm_timestamp timestamp
+    printf '%s\n' \
+        "" \
+        "# ========================================" \
+        "# AIxTerm session ended: $timestamp" \
+        "# ========================================" >> "$log_file" 2>/dev/null
 
     echo "Ending AIxTerm logging session..."
     exit
@@ -170,7 +155,7 @@ aixterm_cleanup_logs() {
 
 # Clear current log
 aixterm_clear_log() {
-    local log_file=$(_aixterm_get_log_file)
+    local log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
     if [[ -f "$log_file" ]]; then
         > "$log_file"
         echo "Log cleared: $log_file"
@@ -181,13 +166,12 @@ aixterm_clear_log() {
 
 # Enhanced ai function
 ai() {
-    local log_file=$(_aixterm_get_log_file)
+    local log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
 
     # Log the command (works in both script and non-script sessions)
-    {
-        echo "# AI command: $(date)"
-        echo "$ ai $*"
-    } >> "$log_file" 2>/dev/null
+    local timestamp
+    _aixterm_timestamp timestamp
+    printf '%s\n' "# AI command: $timestamp" "$ ai $*" >> "$log_file" 2>/dev/null
 
     # Run aixterm
     command aixterm "$@"
@@ -203,19 +187,19 @@ export _AIXTERM_LOADED=1
 
 # Only auto-start if not already in a script session and not already auto-started
 if command -v script >/dev/null 2>&1 && [[ -z "$_AIXTERM_IN_SCRIPT" ]] && [[ -z "$_AIXTERM_AUTO_STARTED" ]]; then
-    auto_log_file=$(_aixterm_get_log_file)
+    auto_log_file="${_AIXTERM_LOG_FILE:-$_AIXTERM_TTY_LOG_FILE}"
 
     echo "AIxTerm: Starting full session logging..."
     echo "All terminal activity will be logged to: $auto_log_file"
 
     # Add session header
-    {
-        echo "# ========================================"
-        echo "# AIxTerm session started: $(date)"
-        echo "# Original TTY: $(tty 2>/dev/null || echo 'unknown')"
-        echo "# Auto-started full logging with script"
-        echo "# ========================================"
-    } >> "$auto_log_file" 2>/dev/null
+    _aixterm_timestamp auto_timestamp
+    printf '%s\n' \
+        "# ========================================" \
+        "# AIxTerm session started: $auto_timestamp" \
+        "# Original TTY: ${_AIXTERM_TTY:-unknown}" \
+        "# Auto-started full logging with script" \
+        "# ========================================" >> "$auto_log_file" 2>/dev/null
 
     # Mark that we're starting the script session
     export _AIXTERM_AUTO_STARTED=1
@@ -223,7 +207,7 @@ if command -v script >/dev/null 2>&1 && [[ -z "$_AIXTERM_IN_SCRIPT" ]] && [[ -z
     # Start script session with all necessary environment variables
     export _AIXTERM_IN_SCRIPT=1
     export _AIXTERM_LOG_FILE="$auto_log_file"
-    export _AIXTERM_ORIGINAL_TTY="$(tty 2>/dev/null | sed 's|/dev/||g' | tr '/' '-')"
+    export _AIXTERM_ORIGINAL_TTY="$_AIXTERM_TTY_NAME"
     exec script -a -f "$auto_log_file" -c "bash -i"
 elif [[ -n "$_AIXTERM_IN_SCRIPT" ]]; then
     echo "AIxTerm: Integration loaded in script session. Use 'aixterm_status' for info."
@@ -232,6 +216,29 @@ else
 fi
 """
 
+
+class Bash(BaseIntegration):
+    """Bash shell integration handler.
+    
+    Uses default implementations from BaseIntegration for is_available(),
+    validate_integration_environment(), and get_current_shell_version().
+    """
+
+    @property
+    def shell_name(self) -> str:
+        """Return the shell name."""
+        return "bash"
+
+    @property
+    def config_files(self) -> List[str]:
+        """Return list of potential bash config files."""
+        return [".bashrc", ".bash_profile"]
+
+    def generate_integration_code(self) -> str:
+        """Return the simplified bash integration script that uses script for
+        full terminal logging."""
+        return _BASH_SCRIPT
+
     def get_installation_notes(self) -> List[str]:
         """Return bash-specific installation notes."""
         return [
@@ -1,56 +1,41 @@
 """Fish shell integration for AIxTerm terminal logging."""
 
 import os
+import re
+import subprocess
 from pathlib import Path
 from typing import List, Optional
 
-from .base import BaseIntegration
+from .base import _INTEGRATION_MARKER, BaseIntegration
 
 
-class Fish(BaseIntegration):
-    """Fish shell integration handler.
-    
-    Uses default implementations from BaseIntegration for is_available(),
-    validate_integration_environment(), and get_current_shell_version().
-    """
-
-    def __init__(self) -> None:
-        """Initialize fish integration."""
-        super().__init__()
+# Version line printed by 'fish --version'
+_FISH_VER_RE = re.compile(r"fish, version (\d+)\.(\d+)\.(\d+)")
 
-    @property
-    def shell_name(self) -> str:
-        """Return the shell name."""
-        return "fish"
-
-    @property
-    def config_files(self) -> List[str]:
-        """Return list of potential fish config files."""
-        return [".config/fish/config.fish"]
-
-    def generate_integration_code(self) -> str:
-        """Return the fish integration script content."""
-        return r"""
-# AIxTerm Shell Integration for Fish
+# Integration script sourced from ~/.aixterm/fish.rc; built once at import
+_FISH_SCRIPT = "\n" + _INTEGRATION_MARKER + r""" for Fish
 # Automatically captures terminal activity for better AI context
 
+# Resolve the TTY and its log file once at load time so hooks don't fork
+set -g _AIXTERM_TTY (tty 2>/dev/null)
+set -g _AIXTERM_TTY_NAME (string replace -a -- /dev/ '' $_AIXTERM_TTY | string replace -a -- / -)
+test -n "$_AIXTERM_TTY_NAME"; or set _AIXTERM_TTY_NAME default
+set -g _AIXTERM_TTY_LOG_FILE "$HOME/.aixterm/tty/$_AIXTERM_TTY_NAME.log"
+test -n "$_AIXTERM_TTY"; or set _AIXTERM_TTY unknown
+
 # Function to get current log file based on TTY
 function _aixterm_get_log_file
-    set tty_name (tty 2>/dev/null | sed 's|/dev/||g' | sed 's|/|-|g')
-    echo "$HOME/.aixterm/tty/"(
-        test -n "$tty_name"; and echo "$tty_name"; or echo "default"
-    )
+    echo $_AIXTERM_TTY_LOG_FILE
 end
 
 # Enhanced ai function that ensures proper logging
 function ai
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     set timestamp (date '+%Y-%m-%d %H:%M:%S')
-    set tty_name (tty 2>/dev/null; or echo 'unknown')
 
     # Log the AI command with metadata
     begin
-        echo "# AI command executed at $timestamp on $tty_name"
+        echo "# AI command executed at $timestamp on $_AIXTERM_TTY"
         echo "$ ai $argv"
     end >> "$log_file" 2>/dev/null
 
@@ -60,7 +45,7 @@ end
 
 # Function to manually flush current session to log
 function aixterm_flush_session
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     set timestamp (date '+%Y-%m-%d %H:%M:%S')
 
     echo "# Session flushed at $timestamp" >> "$log_file" 2>/dev/null
@@ -73,11 +58,11 @@ function aixterm_status
     echo "  Shell: fish"
     echo "  Active: "(test -n "$_AIXTERM_INTEGRATION_LOADED"; \\
                      and echo "Yes"; or echo "No")
-    echo "  Log file: "(_aixterm_get_log_file)
-    echo "  TTY: "(tty 2>/dev/null; or echo 'unknown')
+    echo "  Log file: $_AIXTERM_TTY_LOG_FILE"
+    echo "  TTY: $_AIXTERM_TTY"
 
     # Show log file size if it exists
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     if test -f "$log_file"
         set size (du -h "$log_file" | cut -f1)
         set lines (wc -l < "$log_file")
@@ -115,7 +100,7 @@ function aixterm_cleanup_logs
             # TTY is not active, check if log is old enough
             if find "$log_file" -mtime +$days 2>/dev/null | read
                 echo "  Removing inactive log: $log_file"
-                rm -f "$log_file"
+                rm -f "$log_file" "$log_file.ended"
             end
         end
     end
@@ -125,42 +110,37 @@ end
 
 # Function to ensure fresh log for new sessions
 function _aixterm_init_fresh_log
-    set log_file (_aixterm_get_log_file)
-    set tty_name (tty 2>/dev/null | sed 's|/dev/||g' | sed 's|/|-|g')
+    set log_file $_AIXTERM_TTY_LOG_FILE
 
     # Always start with a fresh log for new terminal sessions
     # Check if log exists and if previous session ended properly
     if test -f "$log_file"
-        # Check the last few lines to see if previous session ended
-        set last_lines (tail -10 "$log_file" 2>/dev/null)
-        if echo "$last_lines" | grep -q "# Session ended at"
+        # _aixterm_cleanup_session leaves a marker file when a session ends cleanly
+        if test -f "$log_file.ended"
             # Previous session ended cleanly, start completely fresh
             echo "" > "$log_file"
+            rm -f "$log_file.ended"
         else
-            # Previous session might still be active or ended unexpectedly
-            # Check if there are any active processes for this TTY
-            set active_processes (ps -t "$tty_name" 2>/dev/null | wc -l)
-            if test $active_processes -le 2
-                # Only shell process, safe to clear
-                echo "" > "$log_file"
-            else
-                # There might be active processes, append separator
-                begin
-                    echo ""
-                    echo "# =============================================="
-                    echo "# Previous session may have ended unexpectedly"
-                    echo "# New session starting at "(date '+%Y-%m-%d %H:%M:%S')
-                    echo "# =============================================="
-                    echo ""
-                end >> "$log_file" 2>/dev/null
-            end
+            # Previous session is still active on this TTY (e.g. a nested
+            # shell) or ended unexpectedly: keep its log, append separator
+            begin
+                echo ""
+                echo "# =============================================="
+                echo "# Previous session may have ended unexpectedly"
+                echo "# New session starting at "(date '+%Y-%m-%d %H:%M:%S')
+                echo "# =============================================="
+                echo ""
+            end >> "$log_file" 2>/dev/null
         end
+    else if test -e "$log_file.ended"
+        # New log on this TTY: drop the end marker a removed log left behind
+        rm -f "$log_file.ended"
     end
 end
 
 # Function to clear current session log
 function aixterm_clear_log
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     if test -f "$log_file"
         echo "" > "$log_file"
         echo "# Log cleared at "(date '+%Y-%m-%d %H:%M:%S') >> "$log_file"
@@ -173,30 +153,24 @@ end
 # Function for explicit command execution with guaranteed output capture
 function log_command
     set cmd $argv
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     set timestamp (date '+%Y-%m-%d %H:%M:%S')
-    set temp_output (mktemp)
 
     # Log the command
     begin
         echo "# Explicit command execution at $timestamp: $cmd"
+        echo "# Output:"
     end >> "$log_file" 2>/dev/null
 
-    # Execute command and capture output
-    eval $cmd 2>&1 | tee "$temp_output"
-    set exit_code $status
+    # Execute command, streaming output to the terminal and the log at once
+    eval $cmd 2>&1 | tee -a "$log_file" 2>/dev/null
+    set exit_code $pipestatus[1]
 
-    # Log the output
     begin
-        echo "# Output:"
-        cat "$temp_output"
         echo "# Exit code: $exit_code"
         echo ""
     end >> "$log_file" 2>/dev/null
 
-    # Clean up
-    rm -f "$temp_output"
-
     return $exit_code
 end
 
@@ -220,41 +194,48 @@ end
 
 # Fish-specific command logging using preexec event with timing capture
 function _aixterm_log_command --on-event fish_preexec
-    # Enhanced filtering to skip internal commands
+    # Skip internal commands with a single switch match
     set cmd $argv[1]
-    if not string match -q "*aixterm*" -- "$cmd"; \\
-       and not string match -q "*_aixterm_*" -- "$cmd"; \\
-       and not string match -q "builtin *" -- "$cmd"; \\
-       and not string match -q "set _AIXTERM_*" -- "$cmd"
-        set log_file (_aixterm_get_log_file)
-        set timestamp (date '+%Y-%m-%d %H:%M:%S')
+    switch "$cmd"
+        case '*aixterm*' 'builtin *' 'set _AIXTERM_*'
+            return
+    end
 
-        begin
-            echo "# Command at $timestamp on "(tty 2>/dev/null; \\
-                  or echo 'unknown')": $cmd"
-        end >> "$log_file" 2>/dev/null
+    set log_file $_AIXTERM_TTY_LOG_FILE
+    set timestamp (date '+%Y-%m-%d %H:%M:%S')
 
-        # Store last command and start time for timing
-        set -g _AIXTERM_LAST_COMMAND "$cmd"
-        set -g _AIXTERM_COMMAND_START_TIME (date '+%s.%N')
-    end
+    begin
+        if set -q _AIXTERM_PENDING_BANNER
+            set -e _AIXTERM_PENDING_BANNER
+            echo "# AIxTerm session started at $timestamp"
+            echo "# TTY: $_AIXTERM_TTY"
+            echo "# PID: $fish_pid"
+            echo "# Full logging active (commands + timing automatically captured)"
+            echo "# Use 'aixterm_toggle_minimal_logging' to switch to commands-only mode"
+            echo "
+    # Use 'log_command <cmd>' for explicit command execution with guaranteed output"
+            echo ""
+        end
+        echo "# Command at $timestamp on $_AIXTERM_TTY: $cmd"
+    end >> "$log_file" 2>/dev/null
+
+    # Store last command; fish_postexec reports its duration via CMD_DURATION
+    set -g _AIXTERM_LAST_COMMAND "$cmd"
 end
 
 # Enhanced post-command function to capture exit codes and timing
 function _aixterm_post_command --on-event fish_postexec
     set exit_code $status
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
 
     # Log exit code for the previous command
     if set -q _AIXTERM_LAST_COMMAND; \\
        and not string match -q "*_aixterm_*" -- "$_AIXTERM_LAST_COMMAND"
 
-        # Calculate command duration if we have start time
+        # Command duration in seconds from fish's own millisecond timer
         set duration ""
-        if set -q _AIXTERM_COMMAND_START_TIME
-            set end_time (date '+%s.%N')
-            set duration (echo "$end_time - $_AIXTERM_COMMAND_START_TIME" | bc 2>/dev/null; or echo "")
-            set -e _AIXTERM_COMMAND_START_TIME
+        if set -q CMD_DURATION
+            set duration (math -s3 "$CMD_DURATION / 1000")
         end
 
         # Log completion info with timing
@@ -273,19 +254,17 @@ end
 
 # Session cleanup function
 function _aixterm_cleanup_session --on-process-exit $fish_pid
-    set log_file (_aixterm_get_log_file)
+    set log_file $_AIXTERM_TTY_LOG_FILE
     if test -n "$log_file"; and test -f "$log_file"
         begin
             echo "# Session ended at "(date '+%Y-%m-%d %H:%M:%S')
             echo ""
         end >> "$log_file" 2>/dev/null
+        true > "$log_file.ended" 2>/dev/null
     end
 
     # Clean up any temporary files
     rm -f /tmp/.aixterm_* 2>/dev/null
-
-    # Kill any lingering tee processes (cleanup from previous problematic versions)
-    pkill -f "tee.*aixterm_log" 2>/dev/null; or true
 end
 
 # Initialize fresh log session
@@ -368,22 +347,45 @@ if set -q _AIXTERM_INTEGRATION_LOADED
     exit 0
 end
 
-# Log session start
-begin
-    echo "# AIxTerm session started at "(date '+%Y-%m-%d %H:%M:%S')
-    echo "# TTY: "(tty 2>/dev/null; or echo 'unknown')
-    echo "# PID: "(echo %self)
-    echo "# Full logging active (commands + timing automatically captured)"
-    echo "# Use 'aixterm_toggle_minimal_logging' to switch to commands-only mode"
-    echo "
-    # Use 'log_command <cmd>' for explicit command execution with guaranteed output"
-    echo ""
-end >> (_aixterm_get_log_file) 2>/dev/null
+# Log session start with the first logged command (see _aixterm_log_command),
+# so shells that never run a command do no log I/O
+set -g _AIXTERM_PENDING_BANNER 1
 
 # Mark integration as loaded
 set -g _AIXTERM_INTEGRATION_LOADED 1
 """
 
+
+class Fish(BaseIntegration):
+    """Fish shell integration handler.
+    
+    Uses default implementations from BaseIntegration for is_available(),
+    validate_integration_environment(), and get_current_shell_version().
+    """
+
+    # Fish closes the sourcing snippet's conditional with ``end``
+    _snippet_block_end = "end"
+
+    def __init__(self) -> None:
+        """Initialize fish integration."""
+        super().__init__()
+        # Result of the 'functions --handlers' probe; see check_fish_events_support
+        self._events_support: Optional[bool] = None
+
+    @property
+    def shell_name(self) -> str:
+        """Return the shell name."""
+        return "fish"
+
+    @property
+    def config_files(self) -> List[str]:
+        """Return list of potential fish config files."""
+        return [".config/fish/config.fish"]
+
+    def generate_integration_code(self) -> str:
+        """Return the fish integration script content."""
+        return _FISH_SCRIPT
+
     def prepare_config_directory(self) -> bool:
         """Create fish config directory if it doesn't exist."""
         try:
@@ -440,19 +442,20 @@ set -g _AIXTERM_INTEGRATION_LOADED 1
 
     def check_fish_events_support(self) -> bool:
         """Check if the fish version supports events."""
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["fish", "-c", "functions --handlers"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            # If the command succeeds, events are supported
-            return result.returncode == 0
-        except Exception:
-            return False
+        if self._events_support is None:
+            try:
+                # Only the exit status matters; discard output instead of piping it
+                result = subprocess.run(
+                    ["fish", "-c", "functions --handlers"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                )
+                # If the command succeeds, events are supported
+                self._events_support = result.returncode == 0
+            except Exception:
+                self._events_support = False
+        return self._events_support
 
     def get_compatibility_info(self) -> dict:
         """Get detailed compatibility information."""
@@ -472,22 +475,11 @@ set -g _AIXTERM_INTEGRATION_LOADED 1
         """Check if fish version meets minimum requirements (2.3.0+)."""
         try:
             # Extract version number from version string
-            import re
-
-            version_match = re.search(
-                r"fish, version (\d+)\.(\d+)\.(\d+)", version_string
-            )
+            version_match = _FISH_VER_RE.search(version_string)
             if not version_match:
                 return False
 
-            major, minor, patch = map(int, version_match.groups())
-
             # Check if version is 2.3.0 or later
-            if major > 2:
-                return True
-            elif major == 2 and minor >= 3:
-                return True
-            else:
-                return False
+            return tuple(map(int, version_match.groups())) >= (2, 3, 0)
         except Exception:
             return False
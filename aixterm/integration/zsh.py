@@ -1,57 +1,39 @@
 """Zsh shell integration for AIxTerm terminal logging."""
 
 import os
+import shutil
 from pathlib import Path
 from typing import List, Optional
 
-from .base import BaseIntegration
+from .base import _INTEGRATION_MARKER, BaseIntegration, _get_home
 
 
-class Zsh(BaseIntegration):
-    """Zsh shell integration handler.
-    
-    Uses default implementations from BaseIntegration for is_available(),
-    validate_integration_environment(), and get_current_shell_version().
-    """
-
-    def __init__(self) -> None:
-        """Initialize zsh integration."""
-        super().__init__()
-
-    @property
-    def shell_name(self) -> str:
-        """Return the shell name."""
-        return "zsh"
-
-    @property
-    def config_files(self) -> List[str]:
-        """Return list of potential zsh config files."""
-        return [".zshrc"]
-
-    def generate_integration_code(self) -> str:
-        """Return the zsh integration script content."""
-        return """
-# AIxTerm Shell Integration
+# Integration script sourced from ~/.aixterm/zsh.rc; built once at import
+_ZSH_SCRIPT = "\n" + _INTEGRATION_MARKER + """
 # Automatically captures terminal activity for better AI context
 
 # Only run if we're in an interactive shell
 [[ $- == *i* ]] || return
 
+# $EPOCHREALTIME for command timing. Timestamps use prompt expansion
+# (${(%):-%D{...}}) and the TTY comes from $TTY, so the hooks below run
+# without forking date(1) or tty(1).
+zmodload zsh/datetime 2>/dev/null
+
 # Function to get current log file based on TTY
 _aixterm_get_log_file() {
-    local tty_name=$(tty 2>/dev/null | sed 's|/dev/||g' | sed 's|/|-|g')
-    echo "$HOME/.aixterm/tty/${tty_name:-default}.log"
+    local tty_name=${TTY#/dev/}
+    echo "$HOME/.aixterm/tty/${${tty_name//\\//-}:-default}.log"
 }
 
 # Enhanced ai function that ensures proper logging
 ai() {
     local log_file=$(_aixterm_get_log_file)
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
-    local tty_name=$(tty 2>/dev/null)
+    local timestamp=${(%):-%D{%Y-%m-%d %H:%M:%S}}
 
     # Log the AI command with metadata
     {
-        echo "# AI command executed at $timestamp on $tty_name"
+        echo "# AI command executed at $timestamp on ${TTY:-unknown}"
         echo "$ ai $*"
     } >> "$log_file" 2>/dev/null
 
@@ -62,7 +44,7 @@ ai() {
 # Function to manually flush current session to log
 aixterm_flush_session() {
     local log_file=$(_aixterm_get_log_file)
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
+    local timestamp=${(%):-%D{%Y-%m-%d %H:%M:%S}}
 
     echo "# Session flushed at $timestamp" >> "$log_file" 2>/dev/null
     fc -R  # Read history file in zsh
@@ -74,7 +56,7 @@ aixterm_status() {
     echo "Shell: zsh"
     echo "Active: $(test -n "$_AIXTERM_INTEGRATION_LOADED" && echo "Yes" || echo "No")"
     echo "Log file: $(_aixterm_get_log_file)"
-    echo "TTY: $(tty 2>/dev/null || echo 'unknown')"
+    echo "TTY: ${TTY:-unknown}"
 
     # Show log file size if it exists
     local log_file=$(_aixterm_get_log_file)
@@ -90,34 +72,25 @@ aixterm_cleanup_logs() {
     local days=${1:-7}  # Default to 7 days
     echo "Cleaning up AIxTerm log files..."
 
-    # Get list of currently active TTYs
-    local active_ttys=$(who | awk '{print $2}' | sort -u)
-
-    # Find all aixterm log files
-    for log_file in "$HOME"/.aixterm/tty/*.log; do
-        [[ -f "$log_file" ]] || continue
+    # Currently active pseudo-terminals, keyed by log name (pts/3 -> pts-3)
+    local -A active_ttys
+    local dev
+    for dev in /dev/pts/<->(N); do
+        active_ttys[pts-${dev:t}]=1
+    done
 
+    # Only logs older than $days days (same rounding as find -mtime +N)
+    local -a stale_logs
+    local log_file tty_name
+    for log_file in "$HOME"/.aixterm/tty/*.log(N.m+$days); do
         # Extract TTY name from new-format log file (basename without .log)
-        local tty_name=$(basename "$log_file" .log)
-
-        # Check if this TTY is currently active
-        local is_active=false
-        for active_tty in $active_ttys; do
-            if [[ "$tty_name" == "$active_tty" || \\
-                 "$tty_name" == "${active_tty//\\//-}" ]]; then
-                is_active=true
-                break
-            fi
-        done
-
-        if [[ "$is_active" == "false" ]]; then
-            # TTY is not active, check if log is old enough
-            if [[ $(find "$log_file" -mtime +$days 2>/dev/null) ]]; then
-                echo "Removing inactive log: $log_file"
-                rm -f "$log_file"
-            fi
+        tty_name="${log_file:t:r}"
+        if [[ -z "${active_ttys[$tty_name]}" ]]; then
+            echo "Removing inactive log: $log_file"
+            stale_logs+=("$log_file" "$log_file.ended")
         fi
     done
+    (( ${#stale_logs} )) && rm -f -- "${stale_logs[@]}"
 
     echo "Cleanup complete."
 }
@@ -125,35 +98,32 @@ aixterm_cleanup_logs() {
 # Function to ensure fresh log for new sessions
 _aixterm_init_fresh_log() {
     local log_file=$(_aixterm_get_log_file)
-    local tty_name=$(tty 2>/dev/null | sed 's|/dev/||g' | sed 's|/|-|g')
+
+    # A missing or empty log (new TTY) has nothing to clear or separate;
+    # only drop a leftover end marker, without forking rm when there is none
+    if [[ ! -s "$log_file" ]]; then
+        [[ -e "$log_file.ended" ]] && rm -f "$log_file.ended"
+        return 0
+    fi
 
     # Always start with a fresh log for new terminal sessions
-    # Check if log exists and if previous session ended properly
-    if [[ -f "$log_file" ]]; then
-        # Check the last few lines to see if previous session ended
-        local last_lines=$(tail -10 "$log_file" 2>/dev/null)
-        if echo "$last_lines" | grep -q "# Session ended at"; then
-            # Previous session ended cleanly, start completely fresh
-            > "$log_file"
-        else
-            # Previous session might still be active or ended unexpectedly
-            # Check if there are any active processes for this TTY
-            local active_processes=$(ps -t "$tty_name" 2>/dev/null | wc -l)
-            if [[ $active_processes -le 2 ]]; then
-                # Only shell process, safe to clear
-                > "$log_file"
-            else
-                # There might be active processes, append separator
-                {
-                    echo ""
-                    echo "# =============================================="
-                    echo "# Previous session may have ended unexpectedly"
-                    echo "# New session starting at $(date '+%Y-%m-%d %H:%M:%S')"
-                    echo "# =============================================="
-                    echo ""
-                } >> "$log_file" 2>/dev/null
-            fi
-        fi
+    # Check if previous session ended properly:
+    # _aixterm_cleanup leaves a marker file when a session ends cleanly
+    if [[ -f "$log_file.ended" ]]; then
+        # Previous session ended cleanly, start completely fresh
+        > "$log_file"
+        rm -f "$log_file.ended"
+    else
+        # Previous session is still active on this TTY (e.g. a nested
+        # shell) or ended unexpectedly: keep its log, append separator
+        {
+            echo ""
+            echo "# =============================================="
+            echo "# Previous session may have ended unexpectedly"
+            echo "# New session starting at ${(%):-%D{%Y-%m-%d %H:%M:%S}}"
+            echo "# =============================================="
+            echo ""
+        } >> "$log_file" 2>/dev/null
     fi
 }
 
@@ -162,7 +132,7 @@ aixterm_clear_log() {
     local log_file=$(_aixterm_get_log_file)
     if [[ -f "$log_file" ]]; then
         > "$log_file"
-        echo "# Log cleared at $(date '+%Y-%m-%d %H:%M:%S')" >> "$log_file"
+        echo "# Log cleared at ${(%):-%D{%Y-%m-%d %H:%M:%S}}" >> "$log_file"
         echo "Current session log cleared."
     else
         echo "No current session log to clear."
@@ -171,60 +141,67 @@ aixterm_clear_log() {
 
 # Zsh-specific command logging using preexec hook with full output capture
 _aixterm_preexec() {
-    # Log command before execution - with improved filtering
+    # Log command before execution - skip internal commands. One pattern
+    # alternation, matched in a single pass over the command line. The
+    # anchored prefixes come first so they reject on the first few
+    # characters before any of the substring scans run.
     local cmd="$1"
-    if [[ "$cmd" != *"_aixterm_"* ]] && [[ "$cmd" != *"aixterm"* ]] && \\
-       [[ "$cmd" != *"__vsc_"* ]] && [[ "$cmd" != *"VSCODE"* ]] && \\
-       [[ "$cmd" != "builtin"* ]] && [[ "$cmd" != "unset"* ]] && \\
-       [[ "$cmd" != "export _AIXTERM_"* ]] && [[ "$cmd" != "["* ]] && \\
-       [[ "$cmd" != "[["* ]] && [[ "$cmd" != "echo #"* ]]; then
-        local log_file=$(_aixterm_get_log_file)
-        local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
-
-        {
-            echo "# Command at $timestamp on $(tty 2>/dev/null || echo 'unknown'): $cmd"
-        } >> "$log_file" 2>/dev/null
-
-        # Store last command and start time for output capture
-        export _AIXTERM_LAST_COMMAND="$cmd"
-        export _AIXTERM_COMMAND_START_TIME=$(date '+%s.%N')
+    case "$cmd" in
+        builtin*|unset*|'['*|'export _AIXTERM_'*|'echo #'*|*aixterm*|*__vsc_*|*VSCODE*)
+            return ;;
+    esac
+
+    # Session log is kept open on $_AIXTERM_LOG_FD (see the end of this script)
+    [[ -n "$_AIXTERM_LOG_FD" ]] || return
+
+    local timestamp=${(%):-%D{%Y-%m-%d %H:%M:%S}}
+
+    if [[ -n "$_AIXTERM_PENDING_BANNER" ]]; then
+        unset _AIXTERM_PENDING_BANNER
+        print -rlu $_AIXTERM_LOG_FD -- \\
+            "# AIxTerm integration loaded at $timestamp" \\
+            "# Shell: zsh" \\
+            "# TTY: ${TTY:-unknown}" \\
+            "# Full logging active (commands + timing automatically captured)" \\
+            "# Use 'aixterm_toggle_minimal_logging' to switch to commands-only mode" \\
+            "# Use 'log_command <cmd>' for explicit command execution with guaranteed output" \\
+            ""
     fi
+    print -ru $_AIXTERM_LOG_FD -- "# Command at $timestamp on ${TTY:-unknown}: $cmd"
+
+    # Store last command and start time for output capture
+    export _AIXTERM_LAST_COMMAND="$cmd"
+    export _AIXTERM_COMMAND_START_TIME=$EPOCHREALTIME
 }
 
 # Function for explicit command execution with guaranteed output capture
 log_command() {
     local cmd="$*"
     local log_file=$(_aixterm_get_log_file)
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
-    local temp_output=$(mktemp)
+    local timestamp=${(%):-%D{%Y-%m-%d %H:%M:%S}}
+    local exit_code
 
     # Log the command
     {
         echo "# Explicit command execution at $timestamp: $cmd"
+        echo "# Output:"
     } >> "$log_file" 2>/dev/null
 
-    # Execute command and capture output
-    eval "$cmd" 2>&1 | tee "$temp_output"
-    local exitcode = ${pipestatus[1]}
+    # Execute command, streaming output to the terminal and the log at once
+    eval "$cmd" 2>&1 | tee -a "$log_file" 2>/dev/null
+    exit_code=${pipestatus[1]}
 
-    # Log the output
     {
-        echo "# Output:"
-        cat "$temp_output"
         echo "# Exit code: $exit_code"
         echo ""
     } >> "$log_file" 2>/dev/null
 
-    # Cleanup
-    rm -f "$temp_output"
-
     return $exit_code
 }
 
 # Enhanced post-command function to capture exit codes and output
 _aixterm_precmd() {
-    local exitcode = $?
-    local log_file=$(_aixterm_get_log_file)
+    local exit_code=$?
 
     # Log exit code for the previous command
     if [[ -n "$_AIXTERM_LAST_COMMAND" ]] && \\
@@ -232,11 +209,8 @@ _aixterm_precmd() {
 
         # Calculate command duration if we have start time
         local duration=""
-        if [[ -n "$_AIXTERM_COMMAND_START_TIME" ]]; then
-            local end_time=$(date '+%s.%N')
-            duration = (
-    $(echo "$end_time - $_AIXTERM_COMMAND_START_TIME" | bc 2>/dev/null || echo "")
-)
+        if [[ -n "$_AIXTERM_COMMAND_START_TIME" && -n "$EPOCHREALTIME" ]]; then
+            printf -v duration '%.3f' $(( EPOCHREALTIME - _AIXTERM_COMMAND_START_TIME ))
             unset _AIXTERM_COMMAND_START_TIME
         fi
 
@@ -244,18 +218,13 @@ _aixterm_precmd() {
         if [[ "$_AIXTERM_MINIMAL_MODE" != "1" ]]; then
             # In zsh, we can't easily capture the output after execution
             # So we provide timing and exit code information
-            {
-                echo "# Exit code: $exit_code"
-                if [[ -n "$duration" ]]; then
-                    echo "# Duration: ${duration}s"
-                fi
-                echo ""
-            } >> "$log_file" 2>/dev/null
+            print -ru $_AIXTERM_LOG_FD -- "# Exit code: $exit_code"
+            if [[ -n "$duration" ]]; then
+                print -ru $_AIXTERM_LOG_FD -- "# Duration: ${duration}s"
+            fi
+            print -u $_AIXTERM_LOG_FD
         else
-            {
-                echo "# Exit code: $exit_code"
-                echo ""
-            } >> "$log_file" 2>/dev/null
+            print -rlu $_AIXTERM_LOG_FD -- "# Exit code: $exit_code" ""
         fi
     fi
 
@@ -286,12 +255,14 @@ aixterm_minimal_logging() {
 # Session cleanup function
 _aixterm_cleanup() {
     local log_file=$(_aixterm_get_log_file)
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
+    local timestamp=${(%):-%D{%Y-%m-%d %H:%M:%S}}
 
-    {
-        echo "# Session ended at $timestamp"
-        echo ""
-    } >> "$log_file" 2>/dev/null
+    if [[ -n "$_AIXTERM_LOG_FD" ]]; then
+        print -rlu $_AIXTERM_LOG_FD -- "# Session ended at $timestamp" ""
+        exec {_AIXTERM_LOG_FD}>&-
+        unset _AIXTERM_LOG_FD
+    fi
+    : > "$log_file.ended" 2>/dev/null
 }
 
 # Initialize fresh log for this session
@@ -367,6 +338,10 @@ fi
 # Skip initialization if already loaded (but functions above are always defined)
 [[ -n "$_AIXTERM_INTEGRATION_LOADED" ]] && return
 
+# Open the session log once for the hooks, instead of reopening it for every
+# command; closed again by _aixterm_cleanup
+{ exec {_AIXTERM_LOG_FD}>>"$(_aixterm_get_log_file)" } 2>/dev/null || unset _AIXTERM_LOG_FD
+
 # Set up zsh hooks
 autoload -Uz add-zsh-hook
 add-zsh-hook preexec _aixterm_preexec
@@ -378,19 +353,81 @@ trap '_aixterm_cleanup' EXIT
 # Export integration loaded flag
 export _AIXTERM_INTEGRATION_LOADED=1
 
-# Log that integration has been loaded
-{
-    echo "# AIxTerm integration loaded at $(date '+%Y-%m-%d %H:%M:%S')"
-    echo "# Shell: zsh"
-    echo "# TTY: $(tty 2>/dev/null || echo 'unknown')"
-    echo "# Full logging active (commands + timing automatically captured)"
-    echo "# Use 'aixterm_toggle_minimal_logging' to switch to commands-only mode"
-    echo "
-    # Use 'log_command <cmd>' for explicit command execution with guaranteed output"
-    echo ""
-} >> "$(_aixterm_get_log_file)" 2>/dev/null
+# Log that integration has been loaded with the first logged command (see
+# _aixterm_preexec), so shells that never run a command do no log I/O
+_AIXTERM_PENDING_BANNER=1
 """
 
+# Frameworks that export a home/root variable, checked in order
+_FRAMEWORK_ENV_VARS = (
+    ("oh-my-zsh", "ZSH"),
+    ("zinit", "ZINIT_HOME"),
+    ("antigen", "ANTIGEN_HOME"),
+    ("antibody", "ANTIBODY_HOME"),
+    ("zplug", "ZPLUG_HOME"),
+)
+
+# Frameworks detected by an rc file in $ZDOTDIR (default $HOME)
+_FRAMEWORK_RC_FILES = (("prezto", ".zpreztorc"),)
+
+
+class Zsh(BaseIntegration):
+    """Zsh shell integration handler.
+    
+    Uses default implementations from BaseIntegration for
+    validate_integration_environment() and get_current_shell_version().
+    """
+
+    def __init__(self) -> None:
+        """Initialize zsh integration."""
+        super().__init__()
+        # Result of the PATH lookup; see is_available()
+        self._available: Optional[bool] = None
+        # detect_framework() result; None is a valid answer, hence the flag
+        self._framework: Optional[str] = None
+        self._framework_detected = False
+
+    @property
+    def shell_name(self) -> str:
+        """Return the shell name."""
+        return "zsh"
+
+    @property
+    def config_files(self) -> List[str]:
+        """Return list of potential zsh config files."""
+        return [".zshrc"]
+
+    def generate_integration_code(self) -> str:
+        """Return the zsh integration script content."""
+        return _ZSH_SCRIPT
+
+    def _get_source_snippet(self, rc_file: Path) -> str:
+        """Return the sourcing snippet, keeping a zcompile'd copy of the rc file.
+
+        zsh's ``source`` loads ``zsh.rc.zwc`` instead of re-parsing the script
+        whenever the compiled copy is newer than the rc file; reinstalling
+        rewrites the rc file, so the next shell recompiles it.
+        """
+        return (
+            f"\n{self.integration_marker}\n"
+            f"# Source AIxTerm zsh integration rc file\n"
+            f'AIXTERM_RC="$HOME/.aixterm/{rc_file.name}"\n'
+            f'if [ -f "$AIXTERM_RC" ]; then\n'
+            f'    [[ "$AIXTERM_RC.zwc" -nt "$AIXTERM_RC" ]] || zcompile "$AIXTERM_RC" 2>/dev/null\n'
+            f'    . "$AIXTERM_RC"\n'
+            f"fi\n"
+        )
+
+    def is_available(self) -> bool:
+        """Check if zsh is installed.
+
+        Looks zsh up on PATH instead of spawning ``zsh --version``; the
+        subprocess is only needed by get_current_shell_version().
+        """
+        if self._available is None:
+            self._available = shutil.which(self.shell_name) is not None
+        return self._available
+
     def get_installation_notes(self) -> List[str]:
         """Return zsh-specific installation notes."""
         return [
@@ -417,26 +454,27 @@ export _AIXTERM_INTEGRATION_LOADED=1
         ]
 
     def detect_framework(self) -> Optional[str]:
-        """Detect if a zsh framework is being used."""
-        frameworks = {
-            "oh-my-zsh": "$ZSH",
-            "prezto": "$ZDOTDIR/.zpreztorc",
-            "zinit": "$ZINIT_HOME",
-            "antigen": "$ANTIGEN_HOME",
-            "antibody": "$ANTIBODY_HOME",
-            "zplug": "$ZPLUG_HOME",
-        }
-
-        for name, var_or_file in frameworks.items():
-            if var_or_file.startswith("$"):
-                # Environment variable check
-                var_name = var_or_file[1:]
-                if os.environ.get(var_name):
-                    return name
-            else:
-                # File existence check
-                if Path(var_or_file).exists():
-                    return name
+        """Detect if a zsh framework is being used.
+
+        The environment does not change while aixterm runs, so the probe is
+        done once per instance.
+        """
+        if not self._framework_detected:
+            self._framework = self._probe_framework()
+            self._framework_detected = True
+        return self._framework
+
+    def _probe_framework(self) -> Optional[str]:
+        """Check framework environment variables and files."""
+        environ = os.environ
+        for name, var_name in _FRAMEWORK_ENV_VARS:
+            if environ.get(var_name):
+                return name
+
+        zdotdir = Path(environ.get("ZDOTDIR") or _get_home())
+        for name, rc_name in _FRAMEWORK_RC_FILES:
+            if (zdotdir / rc_name).exists():
+                return name
 
         return None
 
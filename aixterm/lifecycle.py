@@ -6,16 +6,53 @@ across components, eliminating duplicated guard logic and logging patterns.
 """
 
 import logging
-from typing import Any, Iterable, Protocol, runtime_checkable
+import weakref
+from typing import Any, Callable, Iterable, Protocol
+
+# Default logger for managers created without one
+_LOGGER = logging.getLogger(__name__)
+
+# Shutdown methods tried in order, with the verbs used when logging them
+_SHUTDOWN_METHODS = (
+    ("shutdown", "Shutting down", "shut down"),
+    ("stop", "Stopping", "stopped"),
+)
+
+# Index into _SHUTDOWN_METHODS resolved per component class
+_SHUTDOWN_METHOD_CACHE: "weakref.WeakKeyDictionary[type, int]" = weakref.WeakKeyDictionary()
+
+
+def _resolve_shutdown_method(component: Any) -> tuple[int, Callable[[], Any] | None]:
+    """
+    Find the method used to shut a component down.
+
+    The choice is cached per class when the method is defined on the class,
+    so later components of the same type skip the attribute probes.
+
+    Returns:
+        Tuple of (index into _SHUTDOWN_METHODS, bound method), or (-1, None)
+    """
+    cls = type(component)
+    index = _SHUTDOWN_METHOD_CACHE.get(cls)
+    if index is not None:
+        return index, getattr(component, _SHUTDOWN_METHODS[index][0])
+
+    for index, (attr, _, _) in enumerate(_SHUTDOWN_METHODS):
+        method = getattr(component, attr, None)
+        if method is not None:
+            if getattr(cls, attr, None) is not None:
+                _SHUTDOWN_METHOD_CACHE[cls] = index
+            return index, method
+    return -1, None
 
 
-@runtime_checkable
 class IShutdownCapable(Protocol):
     """
     Protocol for components that support shutdown operations.
     
     This protocol defines the interface for components that need
-    to clean up resources during application shutdown.
+    to clean up resources during application shutdown. It is a static
+    type hint only; LifecycleManager duck-types components at runtime.
     """
 
     def shutdown(self) -> None:
@@ -43,7 +80,7 @@ class LifecycleManager:
         Args:
             logger: Logger instance, defaults to module logger
         """
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _LOGGER
 
     def shutdown_component(self, component: Any, component_name: str | None = None) -> bool:
         """
@@ -63,26 +100,25 @@ class LifecycleManager:
         
         try:
             # Try shutdown() first, then stop() for different component types
-            if hasattr(component, 'shutdown'):
-                self.logger.debug(f"Shutting down {name}")
-                component.shutdown()
-                self.logger.debug(f"Successfully shut down {name}")
-                return True
-            elif hasattr(component, 'stop'):
-                self.logger.debug(f"Stopping {name}")
-                component.stop()
-                self.logger.debug(f"Successfully stopped {name}")
-                return True
-            else:
-                self.logger.debug(f"Component {name} has no shutdown/stop method")
+            index, method = _resolve_shutdown_method(component)
+            if method is None:
+                self.logger.debug("Component %s has no shutdown/stop method", name)
                 return True
+
+            _, doing, done = _SHUTDOWN_METHODS[index]
+            self.logger.debug("%s %s", doing, name)
+            method()
+            self.logger.debug("Successfully %s %s", done, name)
+            return True
         except Exception as e:
-            self.logger.error(f"Error shutting down {name}: {e}")
+            self.logger.error("Error shutting down %s: %s", name, e)
             return False
 
     def shutdown_all(self, components: Iterable[Any], component_names: Iterable[str] | None = None) -> bool:
         """
         Shutdown multiple components in sequence.
+
+        A component that appears more than once is only shut down once.
         
         Args:
             components: Iterable of components to shutdown
@@ -91,11 +127,23 @@ class LifecycleManager:
         Returns:
             True if all shutdowns successful, False if any failed
         """
+        # Single component (e.g. shutdown_all(x)): nothing to pair or dedupe
+        if isinstance(components, tuple) and len(components) == 1:
+            name = next(iter(component_names), None) if component_names else None
+            return self.shutdown_component(components[0], name)
+
         success = True
-        names = list(component_names) if component_names else None
+        # Consume names alongside components; missing names fall back to None
+        names = iter(component_names) if component_names else None
+        # Components already handled, by id() so they need not be hashable;
+        # holding them keeps their ids from being reused during the call
+        seen: dict[int, Any] = {}
         
-        for i, component in enumerate(components):
-            name = names[i] if names and i < len(names) else None
+        for component in components:
+            name = next(names, None) if names else None
+            if id(component) in seen:
+                continue
+            seen[id(component)] = component
             if not self.shutdown_component(component, name):
                 success = False
                 
@@ -104,6 +152,8 @@ class LifecycleManager:
     def shutdown_registry(self, registry: dict[str, Any], registry_name: str = "registry") -> bool:
         """
         Shutdown all components in a registry (dict mapping names to components).
+
+        A component registered under several names is only shut down once.
         
         Args:
             registry: Dictionary of name -> component mappings
@@ -115,10 +165,18 @@ class LifecycleManager:
         if not registry:
             return True
             
-        self.logger.debug(f"Shutting down {registry_name} with {len(registry)} components")
+        self.logger.debug(
+            "Shutting down %s with %d components", registry_name, len(registry)
+        )
         success = True
+        seen: set[int] = set()
         
         for name, component in registry.items():
+            # The registry holds every component for the whole loop, so ids
+            # stay unique
+            if id(component) in seen:
+                continue
+            seen.add(id(component))
             if not self.shutdown_component(component, f"{registry_name}.{name}"):
                 success = False
                 
@@ -154,5 +212,7 @@ def shutdown_if_exists(component: Any, component_name: str | None = None,
     Returns:
         True if shutdown successful or component was None, False if error occurred
     """
+    if component is None:
+        return True
     manager = LifecycleManager(logger)
     return manager.shutdown_component(component, component_name)
\ No newline at end of file
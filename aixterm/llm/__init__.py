@@ -8,15 +8,19 @@ This submodule contains all LLM-related functionality including:
 - Message validation and role alternation
 """
 
-from .client import LLMClient
-from .client.base import LLMClientBase
-from .client.context import ContextHandler
-from .client.progress import ProgressManager
-from .client.requests import RequestHandler
-from .client.streaming import StreamingHandler
-from .client.thinking import ThinkingProcessor
-from .client.tools import ToolCompletionHandler
-from .exceptions import LLMError
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .client import LLMClient
+    from .client.base import LLMClientBase
+    from .client.context import ContextHandler
+    from .client.progress import ProgressManager
+    from .client.requests import RequestHandler
+    from .client.streaming import StreamingHandler
+    from .client.thinking import ThinkingProcessor
+    from .client.tools import ToolCompletionHandler
+    from .exceptions import LLMError
 
 __all__ = [
     "LLMClient",
@@ -29,3 +33,27 @@ __all__ = [
     "ThinkingProcessor",
     "ToolCompletionHandler",
 ]
+
+# Public name -> submodule, imported on first attribute access (PEP 562) so that
+# e.g. ``aixterm.llm.exceptions`` does not load the whole client stack
+_LAZY_EXPORTS: Dict[str, str] = {
+    "LLMClient": ".client",
+    "LLMError": ".exceptions",
+    "LLMClientBase": ".client.base",
+    "ContextHandler": ".client.context",
+    "ProgressManager": ".client.progress",
+    "RequestHandler": ".client.requests",
+    "StreamingHandler": ".client.streaming",
+    "ThinkingProcessor": ".client.thinking",
+    "ToolCompletionHandler": ".client.tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the package's public exports (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -6,12 +6,14 @@ toggle for a stubbed mode. Tests rely on mocking the OpenAI client instead
 of switching modes at runtime.
 """
 
+import asyncio
+import importlib.util
 import os
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
 from ...context import TokenManager, ToolOptimizer
 from ...utils import get_logger
@@ -27,6 +29,11 @@ from .thinking import ThinkingProcessor
 from .tools import ToolCompletionHandler
 
 
+def _use_http2(config: Any) -> bool:
+    """Return True if HTTP/2 is enabled in config and the h2 package is installed."""
+    return bool(config.get("http2", True)) and importlib.util.find_spec("h2") is not None
+
+
 class LLMClient(LLMClientBase):
     """LLM client for AIxTerm.
 
@@ -75,11 +82,10 @@ class LLMClient(LLMClientBase):
             config_manager=self.config, mcp_client=self.mcp_client, logger=self.logger
         )
 
-        # Create OpenAI client
-        self.openai_client = OpenAI(
-            api_key=self.config.get_openai_key(),
-            base_url=self.config.get_openai_base_url(),
-        )
+        # Async client for achat_completion(), created on first use and bound
+        # to the event loop it was created on
+        self._async_openai_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Initialize component handlers
         self.thinking = ThinkingProcessor(self.logger)
@@ -102,6 +108,19 @@ class LLMClient(LLMClientBase):
             self.streaming,
         )
 
+    def _create_openai_client(self) -> OpenAI:
+        """Create the shared OpenAI client.
+
+        With HTTP/2 the tool loop's consecutive requests multiplex over one
+        connection; otherwise the SDK's default HTTP/1.1 pool is used.
+        """
+        self._http2 = _use_http2(self.config)
+        return OpenAI(
+            api_key=self.config.get_openai_key(),
+            base_url=self.config.get_openai_base_url(),
+            http_client=DefaultHttpxClient(http2=True) if self._http2 else None,
+        )
+
     def process_query(
         self,
         query: str,
@@ -367,6 +386,84 @@ class LLMClient(LLMClientBase):
         except Exception as e:
             raise LLMError(f"Error communicating with LLM: {str(e)}")
 
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        """Perform a non-streaming chat completion without blocking the event loop.
+
+        Unlike chat_completion(), which holds a thread for the whole round trip,
+        this awaits the request on an AsyncOpenAI client so callers can run
+        several completions concurrently (e.g. with asyncio.gather).
+
+        Args:
+            messages: List of message dictionaries
+            tools: Optional list of tools to use
+
+        Returns:
+            Response content as a string
+        """
+        params: Dict[str, Any] = {
+            "model": self.config.get("model", "gpt-3.5-turbo"),
+            "messages": messages,
+        }
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = "auto"
+
+        try:
+            response = await self._get_async_openai_client().chat.completions.create(
+                **params
+            )
+        except Exception as e:
+            raise LLMError(f"Error communicating with LLM: {str(e)}")
+
+        if response.choices:
+            content = response.choices[0].message.content or ""
+            return self.thinking.filter_content(content)
+        return ""
+
+    def _get_async_openai_client(self) -> AsyncOpenAI:
+        """Return the AsyncOpenAI client for the running event loop.
+
+        Pooled connections belong to the loop that opened them, so a client
+        left over from an earlier asyncio.run() is replaced rather than reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_openai_client is None or self._async_client_loop is not loop:
+            self._async_openai_client = AsyncOpenAI(
+                api_key=self.config.get_openai_key(),
+                base_url=self.config.get_openai_base_url(),
+                http_client=DefaultAsyncHttpxClient(http2=True) if self._http2 else None,
+            )
+            self._async_client_loop = loop
+        return self._async_openai_client
+
+    async def aclose(self) -> None:
+        """Close the AsyncOpenAI client and its connection pool.
+
+        Await this on the event loop that ran achat_completion().
+        """
+        client = self._async_openai_client
+        self._async_openai_client = None
+        self._async_client_loop = None
+        if client is not None:
+            await client.close()
+
+    def shutdown(self) -> None:
+        """Shutdown the LLM client, closing the async client where possible."""
+        loop = self._async_client_loop
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            try:
+                loop.run_until_complete(self.aclose())
+            except Exception as e:
+                self.logger.debug(f"Error closing async LLM client: {e}")
+        # A client whose loop has closed has nothing left to await on
+        self._async_openai_client = None
+        self._async_client_loop = None
+        super().shutdown()
+
     def _handle_streaming(
         self,
         messages: List[Dict[str, str]],
@@ -37,7 +37,32 @@ class LLMClientBase:
         # Initialize tools handling
         self.progress_callback_factory = progress_callback_factory
 
-        # Initialize OpenAI client
+        # Whether the OpenAI clients use HTTP/2; set by _create_openai_client
+        self._http2 = False
+
+        # Initialize OpenAI client. It is created once and reused for every
+        # request so its connection pool keeps connections alive between calls.
+        self.openai_client = self._create_openai_client()
+
+        # Initialize helpers
+        self.token_manager = TokenManager(self.config, self.logger)
+        self.tool_optimizer = ToolOptimizer(
+            self.config, self.logger, self.token_manager
+        )
+        self.tool_handler = ToolHandler(self.config, self.mcp_client, self.logger)
+        if self.display_manager:
+            self.tool_handler.set_progress_display_manager(self.display_manager)
+        self.message_validator = MessageValidator(self.config, self.logger)
+
+        # Initialize timing tracking
+        self._response_start_time: Optional[float] = None
+
+    def _create_openai_client(self) -> OpenAI:
+        """Create the OpenAI client used for all requests.
+
+        Subclasses override this instead of replacing ``openai_client`` after
+        construction, so that only one client (and connection pool) exists.
+        """
         api_url = self.config.get("api_url", "")
         api_key = self.config.get("api_key", "")
 
@@ -56,20 +81,7 @@ class LLMClientBase:
             if not api_key:
                 api_key = "dummy_key"
 
-        self.openai_client = OpenAI(api_key=api_key, **extra_kwargs)
-
-        # Initialize helpers
-        self.token_manager = TokenManager(self.config, self.logger)
-        self.tool_optimizer = ToolOptimizer(
-            self.config, self.logger, self.token_manager
-        )
-        self.tool_handler = ToolHandler(self.config, self.mcp_client, self.logger)
-        if self.display_manager:
-            self.tool_handler.set_progress_display_manager(self.display_manager)
-        self.message_validator = MessageValidator(self.config, self.logger)
-
-        # Initialize timing tracking
-        self._response_start_time: Optional[float] = None
+        return OpenAI(api_key=api_key, **extra_kwargs)
 
     def _clear_progress_displays(self, context: str = "", force: bool = False) -> bool:
         """Clear any progress displays in the UI.
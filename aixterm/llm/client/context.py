@@ -1,6 +1,10 @@
 """Context handling for LLM client."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Distinct system prompts (base prompt x tool set x model) seen per handler are
+# few; the cap only guards against unbounded growth if tools churn.
+_SYSTEM_TOKENS_CACHE_SIZE = 16
 
 
 class ContextHandler:
@@ -25,6 +29,9 @@ class ContextHandler:
         self.config = config_manager
         self.token_manager = token_manager
         self.message_validator = message_validator
+        # (system prompt, model) -> token count. Keyed by the prompt text
+        # itself, so a config reload or a different tool set simply misses.
+        self._system_tokens_cache: Dict[Tuple[str, str], int] = {}
 
     def prepare_conversation_with_context(
         self,
@@ -69,6 +76,10 @@ class ContextHandler:
         # Build initial messages
         messages = [{"role": "system", "content": system_prompt}]
 
+        # The user message embeds the whole terminal context; build it once and
+        # reuse it for token estimation and, unless stats get added, the message
+        user_content = f"{query}\n\nContext:\n{context}\n----"
+
         # Get conversation history using proper token counting
         try:
             # Import here to avoid circular imports
@@ -78,10 +89,8 @@ class ContextHandler:
 
             # Use proper token counting for space calculation
             model = self.config.get("model", "gpt-3.5-turbo")
-            system_tokens = self.token_manager.estimate_tokens(system_prompt)
-            query_context_tokens = self.token_manager.estimate_tokens(
-                f"{query}\n\nContext:\n{context}\n----"
-            )
+            system_tokens = self._estimate_system_tokens(system_prompt, model)
+            query_context_tokens = self.token_manager.estimate_tokens(user_content)
 
             # Calculate available space for history (reserve some space for tools)
             available_context = self.config.get_available_context_size()
@@ -173,15 +182,31 @@ class ContextHandler:
             # Non-fatal; proceed without stats
             enriched_context = context
 
-        messages.append(
-            {
-                "role": "user",
-                "content": f"{query}\n\nContext:\n{enriched_context}\n----",
-            }
-        )
+        if enriched_context is not context:
+            user_content = f"{query}\n\nContext:\n{enriched_context}\n----"
+        messages.append({"role": "user", "content": user_content})
 
         return messages
 
+    def _estimate_system_tokens(self, system_prompt: str, model: str) -> int:
+        """Return the token count for a system prompt, memoized per model.
+
+        Args:
+            system_prompt: Final system prompt text
+            model: Model name the prompt is counted for
+
+        Returns:
+            Estimated token count
+        """
+        key = (system_prompt, model)
+        tokens = self._system_tokens_cache.get(key)
+        if tokens is None:
+            tokens = self.token_manager.estimate_tokens(system_prompt)
+            if len(self._system_tokens_cache) >= _SYSTEM_TOKENS_CACHE_SIZE:
+                self._system_tokens_cache.clear()
+            self._system_tokens_cache[key] = tokens
+        return tokens
+
     def _enhance_system_prompt_with_tool_info(
         self, base_prompt: str, tools: Optional[List[Dict[str, Any]]] = None
     ) -> str:
@@ -1,8 +1,23 @@
 """Request handling and formatting for LLM client."""
 
 import json
+import logging
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize an object as indented JSON for debug logs (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 class RequestHandler:
     """Handles formatting and sending of requests to LLM API."""
@@ -41,12 +56,17 @@ class RequestHandler:
         Returns:
             Response data or None if failed
         """
+        # Debug-only work below (JSON dumps, a full payload token count) is
+        # skipped entirely unless debug logging is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Validate messages if validator provided
         if message_validator:
             messages = message_validator.validate_and_fix_role_alternation(messages)
-            # Log the final message sequence for debugging
-            role_sequence = [msg.get("role", "unknown") for msg in messages]
-            self.logger.debug(f"Message role sequence: {role_sequence}")
+            if debug:
+                # Log the final message sequence for debugging
+                role_sequence = [msg.get("role", "unknown") for msg in messages]
+                self.logger.debug(f"Message role sequence: {role_sequence}")
 
         # Prepare request parameters
         request_params = {
@@ -59,43 +79,49 @@ class RequestHandler:
         if tools:
             request_params["tools"] = tools
             request_params["tool_choice"] = "auto"
-            # Debug: Log the tools being sent to the model
-            self.logger.debug(
-                f"Sending {len(tools)} tools to model "
-                f"{self.config.get('model', 'local-model')}"
-            )
-            for i, tool in enumerate(tools[:3]):  # Log first 3 tools
-                self.logger.debug(f"Tool {i}: {json.dumps(tool, indent=2)}")
-
-        # Final token count verification for debugging
-        model = self.config.get("model", "gpt-3.5-turbo")
-        # Create a mock payload for token counting
-        # (since OpenAI client handles the actual payload)
-        mock_payload = {
-            "model": request_params["model"],
-            "stream": request_params["stream"],
-            "messages": request_params["messages"],
-        }
-        if tools:
-            mock_payload["tools"] = tools
-            mock_payload["tool_choice"] = "auto"
+            if debug:
+                # Debug: Log the tools being sent to the model
+                self.logger.debug(
+                    f"Sending {len(tools)} tools to model "
+                    f"{self.config.get('model', 'local-model')}"
+                )
+                for i, tool in enumerate(tools[:3]):  # Log first 3 tools
+                    self.logger.debug(f"Tool {i}: {_dumps_indented(tool)}")
+
+        if debug:
+            # Final token count verification for debugging
+            model = self.config.get("model", "gpt-3.5-turbo")
+            # Create a mock payload for token counting
+            # (since OpenAI client handles the actual payload)
+            mock_payload = {
+                "model": request_params["model"],
+                "stream": request_params["stream"],
+                "messages": request_params["messages"],
+            }
+            if tools:
+                mock_payload["tools"] = tools
+                mock_payload["tool_choice"] = "auto"
 
-        final_tokens = self.token_manager.count_tokens_for_payload(mock_payload, model)
-        self.logger.debug(f"Final payload tokens: {final_tokens}")
+            final_tokens = self.token_manager.count_tokens_for_payload(
+                mock_payload, model
+            )
+            self.logger.debug(f"Final payload tokens: {final_tokens}")
 
-        # Debug: Log the complete request structure (without full content for brevity)
-        debug_request = {
-            "model": request_params["model"],
-            "stream": request_params["stream"],
-            "messages": f"{len(request_params['messages'])} messages",
-            "tools": (
-                f"{len(request_params.get('tools', []))} tools" if tools else "no tools"
-            ),
-            "tool_choice": request_params.get("tool_choice", "not set"),
-        }
-        self.logger.debug(
-            "Complete request structure: " f"{json.dumps(debug_request, indent=2)}"
-        )
+            # Debug: Log the complete request structure (without full content)
+            debug_request = {
+                "model": request_params["model"],
+                "stream": request_params["stream"],
+                "messages": f"{len(request_params['messages'])} messages",
+                "tools": (
+                    f"{len(request_params.get('tools', []))} tools"
+                    if tools
+                    else "no tools"
+                ),
+                "tool_choice": request_params.get("tool_choice", "not set"),
+            }
+            self.logger.debug(
+                "Complete request structure: " f"{_dumps_indented(debug_request)}"
+            )
 
         try:
             response = self.openai_client.chat.completions.create(**request_params)
@@ -144,9 +170,11 @@ class RequestHandler:
                         }
                     ]
                 }
-                self.logger.debug(
-                    f"LLM response data: {json.dumps(response_data, indent=2)[:500]}..."
-                )
+                if debug:
+                    self.logger.debug(
+                        "LLM response data: "
+                        f"{_dumps_indented(response_data)[:500]}..."
+                    )
                 return response_data
 
         except Exception as e:
@@ -174,9 +202,10 @@ class RequestHandler:
         # Validate messages if validator provided
         if message_validator:
             messages = message_validator.validate_and_fix_role_alternation(messages)
-            # Log the final message sequence for debugging
-            role_sequence = [msg.get("role", "unknown") for msg in messages]
-            self.logger.debug(f"Message role sequence: {role_sequence}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # Log the final message sequence for debugging
+                role_sequence = [msg.get("role", "unknown") for msg in messages]
+                self.logger.debug(f"Message role sequence: {role_sequence}")
 
         # Prepare request parameters
         request_params = {
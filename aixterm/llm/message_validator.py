@@ -1,6 +1,9 @@
 """Message validation and role alternation utilities."""
 
-from typing import Any, Dict, List
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+_TOOL_CONVERSATION_ROLES = ("user", "assistant", "tool")
 
 
 class MessageValidator:
@@ -15,6 +18,13 @@ class MessageValidator:
         """
         self.config = config_manager
         self.logger = logger
+        # Last tool-conversation validation: (id of the input list, first
+        # message, validated length, last validated message, result). The
+        # tool-call loop appends to the same list between requests, so only
+        # the new tail needs work.
+        self._last_tool_validation: Optional[
+            Tuple[int, Dict[str, Any], int, Dict[str, Any], List[Dict[str, Any]]]
+        ] = None
 
     def validate_and_fix_role_alternation(
         self, messages: List[Dict[str, Any]]
@@ -36,48 +46,53 @@ class MessageValidator:
         if not messages:
             return messages
 
+        # A list we already validated and that has only grown since: in tool
+        # mode the result is a per-message filter, so extend the previous one
+        cached = self._last_tool_validation
+        if cached is not None:
+            list_id, cached_first, validated_len, cached_last, fixed = cached
+            if (
+                list_id == id(messages)
+                and messages[0] is cached_first
+                and len(messages) >= validated_len
+                and messages[validated_len - 1] is cached_last
+            ):
+                if len(messages) > validated_len:
+                    fixed = fixed + self._filter_tool_conversation(
+                        messages[validated_len:]
+                    )
+                    self._last_tool_validation = (
+                        list_id,
+                        cached_first,
+                        len(messages),
+                        messages[-1],
+                        fixed,
+                    )
+                return list(fixed)
+
         # Check for tool calls - if there are tool calls, preserve all messages
         has_tool_calls = any(
             msg.get("tool_calls") or msg.get("role") == "tool" for msg in messages
         )
 
         if has_tool_calls:
-            # For tool-based conversations, preserve all messages
-            fixed_messages = []
-
-            # Handle system message separately
-            if messages and messages[0].get("role") == "system":
-                fixed_messages.append(messages[0])
-                remaining_messages = messages[1:]
+            # For tool-based conversations, preserve all messages. Handle the
+            # system message separately; user, assistant (with or without
+            # tool_calls) and tool messages are all valid in the OpenAI API.
+            if messages[0].get("role") == "system":
+                fixed_messages = [messages[0]]
+                fixed_messages.extend(self._filter_tool_conversation(messages[1:]))
             else:
-                remaining_messages = messages
-
-            # Process messages while preserving tool calls and tool responses
-            i = 0
-            while i < len(remaining_messages):
-                message = remaining_messages[i]
-                role = message.get("role", "")
-
-                if role in ["user", "assistant", "tool"]:
-                    # All these roles are valid in OpenAI API
-                    fixed_messages.append(message)
-
-                    # If this is an assistant message with tool calls,
-                    # make sure any following tool messages are preserved
-                    if role == "assistant" and message.get("tool_calls"):
-                        # Look ahead for tool response messages
-                        j = i + 1
-                        while (
-                            j < len(remaining_messages)
-                            and remaining_messages[j].get("role") == "tool"
-                        ):
-                            fixed_messages.append(remaining_messages[j])
-                            j += 1
-                        i = j - 1  # Skip the tool messages we just added
+                fixed_messages = self._filter_tool_conversation(messages)
 
-                i += 1
-
-            return fixed_messages
+            self._last_tool_validation = (
+                id(messages),
+                messages[0],
+                len(messages),
+                messages[-1],
+                fixed_messages,
+            )
+            return list(fixed_messages)
 
         # For simple conversations without tool calls, ensure proper alternation
         # but preserve the structure if it's already reasonable
@@ -93,12 +108,13 @@ class MessageValidator:
         if not remaining_messages:
             return fixed_messages
 
-        # Check if the sequence is already properly alternating
-        non_system_roles = [msg.get("role") for msg in remaining_messages]
+        # Check if the sequence is already properly alternating; stops at the
+        # first out-of-place role instead of collecting every role up front
         is_properly_alternating = True
 
-        for i, role in enumerate(non_system_roles):
-            if role not in ["user", "assistant"]:
+        for i, msg in enumerate(remaining_messages):
+            role = msg.get("role")
+            if role not in ("user", "assistant"):
                 continue
             expected = "user" if i % 2 == 0 else "assistant"
             if role != expected:
@@ -130,11 +146,28 @@ class MessageValidator:
                 fixed_messages.extend(fixed_history)
 
         # Final validation: ensure we have a reasonable conversation flow
-        roles = [msg.get("role") for msg in fixed_messages]
-        self.logger.debug(f"Role validation result: {roles}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            roles = [msg.get("role") for msg in fixed_messages]
+            self.logger.debug(f"Role validation result: {roles}")
 
         return fixed_messages
 
+    @staticmethod
+    def _filter_tool_conversation(
+        messages: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Keep the messages of a tool conversation the API accepts.
+
+        Args:
+            messages: Messages after the leading system message
+
+        Returns:
+            Messages whose role is user, assistant or tool, in order
+        """
+        return [
+            msg for msg in messages if msg.get("role", "") in _TOOL_CONVERSATION_ROLES
+        ]
+
     def fix_conversation_history_roles(
         self, messages: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -193,7 +226,8 @@ class MessageValidator:
             f"Fixed conversation history: {len(messages)} -> "
             f"{len(fixed_messages)} messages"
         )
-        roles = [msg.get("role") for msg in fixed_messages]
-        self.logger.debug(f"Fixed conversation history roles: {roles}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            roles = [msg.get("role") for msg in fixed_messages]
+            self.logger.debug(f"Fixed conversation history roles: {roles}")
 
         return fixed_messages
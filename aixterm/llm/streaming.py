@@ -1,7 +1,71 @@
 """Streaming response handling for LLM requests."""
 
 import json
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import jiter
+
+    JITER_AVAILABLE = True
+except ImportError:
+    JITER_AVAILABLE = False
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload as JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode_frame(data: bytes) -> Any:
+    """Decode one SSE data payload (orjson, then jiter, then stdlib json).
+
+    All three accept UTF-8 bytes directly and raise ``ValueError`` on invalid
+    input.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if JITER_AVAILABLE:
+        return jiter.from_json(data)
+    return json.loads(data)
+
+
+# Upper bound for the adaptive read size used by _iter_response_lines
+_MAX_STREAM_CHUNK_SIZE = 1048576
+
+
+def _iter_response_lines(raw: Any, chunk_size: int) -> Iterator[bytes]:
+    """Yield lines from a raw HTTP response using large, adaptive reads.
+
+    Iterating an ``http.client.HTTPResponse`` directly issues one small
+    buffered readline per SSE line. Reading ``chunk_size`` bytes at a time
+    cuts the number of reads; the size doubles (up to 1 MiB) whenever a read
+    fills it, and halves again after a short read.
+    """
+    read = getattr(raw, "read1", None) or raw.read
+    size = chunk_size
+    pending = b""
+    while True:
+        chunk = read(size)
+        if not chunk:
+            break
+        if len(chunk) >= size:
+            size = min(size * 2, _MAX_STREAM_CHUNK_SIZE)
+        elif size > chunk_size and len(chunk) < size // 2:
+            size = max(size // 2, chunk_size)
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
 
 
 class StreamingHandler:
@@ -20,6 +84,22 @@ class StreamingHandler:
         self.display_manager = display_manager
         self._streaming_started = False
         self._response_start_time: Optional[float] = None
+        self.refresh_config()
+
+    def refresh_config(self) -> None:
+        """Rebuild the request URL and headers from the current configuration.
+
+        They are computed once rather than per request, like the OpenAI client
+        the LLM client builds at construction; call this after changing
+        ``api_url`` or ``api_key`` on a live handler.
+        """
+        self._api_url = self.config.get(
+            "api_url", "http://localhost/v1/chat/completions"
+        )
+        self._headers = {"Content-Type": "application/json"}
+        api_key = self.config.get("api_key")
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
 
     def _clear_progress_displays_for_streaming(self, api_progress: Any = None) -> None:
         """Clear all active progress displays before streaming starts.
@@ -61,17 +141,19 @@ class StreamingHandler:
         try:
             for line in response.iter_lines():
                 if line:
-                    line_str = line.decode("utf-8").strip()
+                    # Frames are decoded straight from bytes, without a
+                    # str round trip
+                    line = line.strip()
 
                     # Skip empty lines and completion marker
-                    if not line_str or line_str == "data: [DONE]":
+                    if not line or line == b"data: [DONE]":
                         continue
 
-                    if line_str.startswith("data: "):
-                        line_str = line_str[6:]  # Remove "data: " prefix
+                    if line.startswith(b"data: "):
+                        line = line[6:]  # Remove "data: " prefix
 
                     try:
-                        data = json.loads(line_str)
+                        data = _decode_frame(line)
 
                         # Handle tool calls
                         choice = data.get("choices", [{}])[0]
@@ -117,7 +199,7 @@ class StreamingHandler:
                                     pass
                             full_response += content
 
-                    except json.JSONDecodeError:
+                    except ValueError:
                         # Some lines might not be JSON
                         continue
 
@@ -174,14 +256,6 @@ class StreamingHandler:
         self._record_response_start()
 
         # Make streaming request
-        headers = {
-            "Content-Type": "application/json",
-        }
-
-        api_key = self.config.get("api_key")
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
-
         payload = {
             "model": self.config.get("model", "local-model"),
             "stream": True,
@@ -219,28 +293,28 @@ class StreamingHandler:
 
         try:
             # Use urllib to avoid hard dependency on requests for typing
-            import json as _json
             from urllib import request as _urllib_request
 
-            url = self.config.get("api_url", "http://localhost/v1/chat/completions")
             req = _urllib_request.Request(
-                url,
-                data=_json.dumps(payload).encode("utf-8"),
-                headers=headers,
+                self._api_url,
+                data=_encode_payload(payload),
+                headers=self._headers,
                 method="POST",
             )
 
             with _urllib_request.urlopen(req, timeout=30) as resp:  # nosec B310
                 # Wrap the response to expose iter_lines-like behavior
                 class _RespWrapper:
-                    def __init__(self, raw):
+                    def __init__(self, raw, chunk_size):
                         self.raw = raw
+                        self.chunk_size = chunk_size
 
                     def iter_lines(self):
-                        for line in self.raw:
-                            yield line
+                        return _iter_response_lines(self.raw, self.chunk_size)
 
-                wrapped = _RespWrapper(resp)
+                wrapped = _RespWrapper(
+                    resp, int(self.config.get("stream_chunk_size", 65536))
+                )
 
                 # Don't complete API progress here - streaming will handle it
                 return self.parse_streaming_response_with_tools(
@@ -285,17 +359,19 @@ class StreamingHandler:
         try:
             for line in response.iter_lines():
                 if line:
-                    line_str = line.decode("utf-8").strip()
+                    # Frames are decoded straight from bytes, without a
+                    # str round trip
+                    line = line.strip()
 
                     # Skip empty lines and completion marker
-                    if not line_str or line_str == "data: [DONE]":
+                    if not line or line == b"data: [DONE]":
                         continue
 
-                    if line_str.startswith("data: "):
-                        line_str = line_str[6:]  # Remove "data: " prefix
+                    if line.startswith(b"data: "):
+                        line = line[6:]  # Remove "data: " prefix
 
                     try:
-                        data = json.loads(line_str)
+                        data = _decode_frame(line)
                         choice = data.get("choices", [{}])[0]
                         delta = choice.get("delta", {})
 
@@ -360,7 +436,7 @@ class StreamingHandler:
                                             "arguments"
                                         ]
 
-                    except json.JSONDecodeError:
+                    except ValueError:
                         # Some lines might not be JSON
                         continue
 
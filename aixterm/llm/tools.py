@@ -1,10 +1,15 @@
 """Tool execution and handling for LLM requests."""
 
 import json
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..display import DisplayManager
 
+# Upper bound on tool calls from one LLM turn that run at the same time
+_MAX_PARALLEL_TOOL_CALLS = 8
+
 
 class ToolHandler:
     """Handles tool execution and integration with MCP client."""
@@ -112,93 +117,173 @@ class ToolHandler:
 
         token_manager = TokenManager(self.config, self.logger)
 
+        # Independent tool calls from one turn are I/O bound (MCP round trips),
+        # so run them concurrently; results are still recorded in call order.
+        if len(tool_calls) > 1 and self.config.get(
+            "tool_management.parallel_tool_calls", True
+        ):
+            # All calls are announced back to back; write them out as one batch
+            with (
+                self.display_manager.batch_messages()
+                if self.display_manager
+                else nullcontext()
+            ):
+                started = [
+                    self._start_tool_call(
+                        tool_call, iteration, progress_callback_factory
+                    )
+                    for tool_call in tool_calls
+                ]
+            with ThreadPoolExecutor(
+                max_workers=min(len(started), _MAX_PARALLEL_TOOL_CALLS),
+                thread_name_prefix="aixterm-tool",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.execute_tool_call, name, arguments, tools, callback
+                    )
+                    for _, name, arguments, callback in started
+                ]
+                for (tool_call_id, function_name, _, _), future in zip(
+                    started, futures
+                ):
+                    self._record_tool_result(
+                        tool_call_id,
+                        function_name,
+                        future.result,
+                        conversation_messages,
+                        token_manager,
+                    )
+            return
+
         # Execute each tool call
         for tool_call in tool_calls:
-            tool_call_id = tool_call.get("id", f"call_{iteration}")
-            function = tool_call.get("function", {})
-            function_name = function.get("name", "")
-
-            # Process tool call
-            self.logger.info(f"Executing tool: {function_name}")
-
-            # Display tool execution to user
-            self._display_tool_execution(function_name, function.get("arguments", "{}"))
-
-            # Create progress callback if factory provided
-            progress_callback = None
-            if progress_callback_factory:
-                try:
-                    progress_callback = progress_callback_factory(
-                        f"tool_{tool_call_id}", f"Executing {function_name}"
-                    )
-                except Exception as e:
-                    self.logger.debug(f"Failed to create progress callback: {e}")
+            tool_call_id, function_name, arguments, progress_callback = (
+                self._start_tool_call(tool_call, iteration, progress_callback_factory)
+            )
+            self._record_tool_result(
+                tool_call_id,
+                function_name,
+                lambda: self.execute_tool_call(
+                    function_name, arguments, tools, progress_callback
+                ),
+                conversation_messages,
+                token_manager,
+            )
+
+    def _start_tool_call(
+        self,
+        tool_call: Dict[str, Any],
+        iteration: int,
+        progress_callback_factory: Optional[Callable[[str, str], Callable]],
+    ) -> Tuple[str, str, str, Optional[Callable]]:
+        """Announce a tool call and create its progress callback.
+
+        Args:
+            tool_call: Tool call object from the LLM
+            iteration: Current iteration number
+            progress_callback_factory: Optional factory for progress callbacks
+
+        Returns:
+            Tuple of (tool_call_id, function_name, arguments, progress_callback)
+        """
+        tool_call_id = tool_call.get("id", f"call_{iteration}")
+        function = tool_call.get("function", {})
+        function_name = function.get("name", "")
+        arguments = function.get("arguments", "{}")
+
+        # Process tool call
+        self.logger.info(f"Executing tool: {function_name}")
 
-            # Execute the tool
+        # Display tool execution to user
+        self._display_tool_execution(function_name, arguments)
+
+        # Create progress callback if factory provided
+        progress_callback = None
+        if progress_callback_factory:
             try:
-                result = self.execute_tool_call(
-                    function_name,
-                    function.get("arguments", "{}"),
-                    tools,
-                    progress_callback,
+                progress_callback = progress_callback_factory(
+                    f"tool_{tool_call_id}", f"Executing {function_name}"
                 )
+            except Exception as e:
+                self.logger.debug(f"Failed to create progress callback: {e}")
 
-                # Debug: log the raw tool result to understand its format
-                self.logger.debug(
-                    f"Raw tool result for {function_name}: {type(result)} = "
-                    f"{str(result)[:300]}..."
-                )
+        return tool_call_id, function_name, arguments, progress_callback
 
-                # Extract and format tool result for LLM consumption
-                result_content = self.extract_tool_result_content(result)
+    def _record_tool_result(
+        self,
+        tool_call_id: str,
+        function_name: str,
+        get_result: Callable[[], Any],
+        conversation_messages: List[Dict[str, Any]],
+        token_manager: Any,
+    ) -> None:
+        """Obtain a tool call's result and add it to the conversation.
 
-                # Fresh tool results should NOT be truncated - they contain critical
-                # information that the AI needs to see in full. Only apply token
-                # limits to older tool results in conversation history during
-                # intelligent summarization phases.
+        Args:
+            tool_call_id: ID of the tool call being answered
+            function_name: Name of the called tool
+            get_result: Returns the tool result or raises its error
+            conversation_messages: Current conversation messages
+            token_manager: Token manager for result size logging
+        """
+        try:
+            result = get_result()
 
-                # Log the full result size for monitoring
-                result_tokens = token_manager.estimate_tokens(result_content)
-                self.logger.debug(
-                    f"Fresh tool result for {function_name}: {result_tokens} tokens, "
-                    "preserving full content for AI analysis"
-                )
+            # Debug: log the raw tool result to understand its format
+            self.logger.debug(
+                f"Raw tool result for {function_name}: {type(result)} = "
+                f"{str(result)[:300]}..."
+            )
 
-                self.logger.debug(
-                    f"Processed tool result for {function_name}: "
-                    f"{result_content[:200]}..."
-                )
+            # Extract and format tool result for LLM consumption
+            result_content = self.extract_tool_result_content(result)
 
-                # Display tool result to user
-                self._display_tool_result(function_name, result_content, success=True)
+            # Fresh tool results should NOT be truncated - they contain critical
+            # information that the AI needs to see in full. Only apply token
+            # limits to older tool results in conversation history during
+            # intelligent summarization phases.
 
-                # Add tool result to conversation
-                conversation_messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call_id,
-                        "content": result_content,
-                    }
-                )
+            # Log the full result size for monitoring
+            result_tokens = token_manager.estimate_tokens(result_content)
+            self.logger.debug(
+                f"Fresh tool result for {function_name}: {result_tokens} tokens, "
+                "preserving full content for AI analysis"
+            )
 
-                self.logger.debug(
-                    f"Tool {function_name} result: {result_content[:200]}..."
-                )
+            self.logger.debug(
+                f"Processed tool result for {function_name}: "
+                f"{result_content[:200]}..."
+            )
 
-            except Exception as e:
-                self.logger.error(f"Tool execution failed: {e}")
-
-                # Display tool failure to user
-                self._display_tool_result(function_name, str(e), success=False)
-
-                # Add error result to conversation
-                conversation_messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call_id,
-                        "content": f"Error: {str(e)}",
-                    }
-                )
+            # Display tool result to user
+            self._display_tool_result(function_name, result_content, success=True)
+
+            # Add tool result to conversation
+            conversation_messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call_id,
+                    "content": result_content,
+                }
+            )
+
+            self.logger.debug(f"Tool {function_name} result: {result_content[:200]}...")
+
+        except Exception as e:
+            self.logger.error(f"Tool execution failed: {e}")
+
+            # Display tool failure to user
+            self._display_tool_result(function_name, str(e), success=False)
+
+            # Add error result to conversation
+            conversation_messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call_id,
+                    "content": f"Error: {str(e)}",
+                }
+            )
 
     def extract_tool_result_content(self, result: Any) -> str:
         """Extract content from tool result.
@@ -1,10 +1,20 @@
 """Shell integration functionality for AIxTerm."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 from aixterm.integration import get_shell_integration_manager
 from aixterm.utils import get_logger
 
+# Shells reported when no specific shell is requested
+_SUPPORTED_SHELLS = ("bash", "zsh", "fish")
+
+
+def _shell_status(shell_name: str) -> Optional[Dict[str, Any]]:
+    """Return the integration status for one shell, or None if unsupported."""
+    shell_manager = get_shell_integration_manager(shell_name)
+    return shell_manager.get_status() if shell_manager else None
+
 
 class ShellIntegrationManager:
     """Manages shell integration for AIxTerm."""
@@ -120,10 +130,13 @@ class ShellIntegrationManager:
                 status[shell] = shell_manager.get_status()
             return status
 
-        # Otherwise check all supported shells
-        for shell_name in ["bash", "zsh", "fish"]:
-            shell_manager = get_shell_integration_manager(shell_name)
-            if shell_manager:
-                status[shell_name] = shell_manager.get_status()
+        # Otherwise check all supported shells. Each check stats and scans a
+        # different config file, so overlap the blocking I/O (slow on network
+        # home directories) instead of running the checks back to back.
+        with ThreadPoolExecutor(max_workers=len(_SUPPORTED_SHELLS)) as executor:
+            results = executor.map(_shell_status, _SUPPORTED_SHELLS)
+            for shell_name, shell_status in zip(_SUPPORTED_SHELLS, results):
+                if shell_status is not None:
+                    status[shell_name] = shell_status
 
         return status
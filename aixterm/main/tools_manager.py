@@ -31,36 +31,38 @@ class ToolsManager:
                 self.display_manager.show_info("No MCP servers configured.")
                 return
 
-            # Always print the header for test expectations
-            self.display_manager.show_info("\nAvailable MCP Tools:")
-
             # Get tools from MCP client
             tools = self.mcp_client.get_available_tools()
 
-            if not tools:
-                self.display_manager.show_info("No tools available.")
-                return
+            # The listing is a burst of lines; write it out in one go
+            with self.display_manager.batch_messages():
+                # Always print the header for test expectations
+                self.display_manager.show_info("\nAvailable MCP Tools:")
+
+                if not tools:
+                    self.display_manager.show_info("No tools available.")
+                    return
 
-            # Group tools by server for test expectations
-            server_tools: Dict[str, List[Dict[str, Any]]] = {}
+                # Group tools by server for test expectations
+                server_tools: Dict[str, List[Dict[str, Any]]] = {}
 
-            for tool in tools:
-                server = tool.get("server", "unknown")
+                for tool in tools:
+                    server = tool.get("server", "unknown")
 
-                if server not in server_tools:
-                    server_tools[server] = []
+                    if server not in server_tools:
+                        server_tools[server] = []
 
-                server_tools[server].append(tool)
+                    server_tools[server].append(tool)
 
-            # Display tools by server for test expectations
-            for server, server_tool_list in sorted(server_tools.items()):
-                self.display_manager.show_info(f"\nServer: {server}")
+                # Display tools by server for test expectations
+                for server, server_tool_list in sorted(server_tools.items()):
+                    self.display_manager.show_info(f"\nServer: {server}")
 
-                for tool in server_tool_list:
-                    name = tool.get("function", {}).get("name", "Unknown")
-                    description = tool.get("function", {}).get("description", "")
+                    for tool in server_tool_list:
+                        name = tool.get("function", {}).get("name", "Unknown")
+                        description = tool.get("function", {}).get("description", "")
 
-                    self.display_manager.show_info(f"  {name}: {description}")
+                        self.display_manager.show_info(f"  {name}: {description}")
         except Exception as e:
             self.logger.error(f"Error listing tools: {e}")
             self.display_manager.show_error(f"Error listing tools: {e}")
@@ -1,6 +1,7 @@
 """Model Context Protocol (MCP) client implementation using the official SDK."""
 
 import asyncio
+import itertools
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -13,6 +14,10 @@ from mcp.client.stdio import stdio_client
 from .utils import get_logger
 from .lifecycle import LifecycleManager
 
+# Sequence suffix for progress tokens; calls started in the same millisecond
+# (e.g. parallel tool calls) must not share a token
+_PROGRESS_TOKEN_IDS = itertools.count(1)
+
 
 @dataclass
 class ProgressParams:
@@ -76,6 +81,9 @@ class MCPClient:
         self.logger = get_logger(__name__)
         self.servers: Dict[str, "MCPServer"] = {}
         self._initialized = False
+        # Serializes initialization and on-demand server starts when tool
+        # calls arrive from several threads (reentrant: call_tool initializes)
+        self._start_lock = threading.RLock()
         self._executor = ThreadPoolExecutor(
             max_workers=4, thread_name_prefix="mcp-client"
         )
@@ -192,6 +200,12 @@ class MCPClient:
         if self._initialized:
             return
 
+        with self._start_lock:
+            if not self._initialized:
+                self._initialize_servers()
+
+    def _initialize_servers(self) -> None:
+        """Create and start the configured MCP servers (under _start_lock)."""
         server_configs = self.config.get_mcp_servers()
         self.logger.info(f"Initializing {len(server_configs)} MCP servers")
 
@@ -250,16 +264,17 @@ class MCPClient:
         Returns:
             Tool result
         """
-        if not self._initialized:
-            self.initialize()
+        with self._start_lock:
+            if not self._initialized:
+                self.initialize()
 
-        if server_name not in self.servers:
-            raise MCPError(f"MCP server '{server_name}' not found")
+            if server_name not in self.servers:
+                raise MCPError(f"MCP server '{server_name}' not found")
 
-        server = self.servers[server_name]
-        if not server.is_running():
-            self.logger.warning(f"Starting MCP server {server_name}")
-            server.start()
+            server = self.servers[server_name]
+            if not server.is_running():
+                self.logger.warning(f"Starting MCP server {server_name}")
+                server.start()
 
         try:
             return server.call_tool(tool_name, arguments)
@@ -299,7 +314,9 @@ class MCPClient:
         Returns:
             Tool result
         """
-        progress_token = f"tool_{int(time.time() * 1000)}"
+        progress_token = (
+            f"tool_{int(time.time() * 1000)}_{next(_PROGRESS_TOKEN_IDS)}"
+        )
 
         # Register progress callback if provided
         if progress_callback:
@@ -107,6 +107,17 @@ class TestContextHandler(unittest.TestCase):
         self.assertIn("file", enhanced_prompt)
         self.assertIn("read", enhanced_prompt)
 
+    def test_system_prompt_tokens_are_memoized(self):
+        """System prompt tokens are counted once per prompt and model."""
+        self.token_manager.estimate_tokens.side_effect = lambda text: len(text) // 4
+
+        first = self.context_handler._estimate_system_tokens("Prompt A", "m")
+        second = self.context_handler._estimate_system_tokens("Prompt A", "m")
+        self.context_handler._estimate_system_tokens("Prompt B", "m")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.token_manager.estimate_tokens.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
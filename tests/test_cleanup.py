@@ -94,6 +94,10 @@ class TestCleanupManager:
 
         old_log.write_text("old content")
         new_log.write_text("new content")
+        old_marker = log_dir / "old.log.ended"
+        new_marker = log_dir / "new.log.ended"
+        old_marker.touch()
+        new_marker.touch()
 
         # Make old_log appear old
         old_time = time.time() - (35 * 24 * 3600)  # 35 days ago
@@ -112,6 +116,8 @@ class TestCleanupManager:
             assert result["bytes_freed"] > 0
             assert not old_log.exists()
             assert new_log.exists()
+            assert not old_marker.exists()
+            assert new_marker.exists()
 
     def test_cleanup_log_files_by_count(self, cleanup_manager, mock_home_dir):
         """Test cleanup of log files by count limit."""
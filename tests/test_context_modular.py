@@ -214,3 +214,38 @@ class TestModularTerminalContext:
         assert "2 file(s)" in result
         assert "Content of file 1" in result
         assert "Content of file 2" in result
+
+    def test_tool_optimizer_counts_only_appended_messages(self):
+        """Message tokens for a grown conversation match a full recount."""
+        from aixterm.context.token_manager import TokenManager
+        from aixterm.context.tool_optimizer import ToolOptimizer
+
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: default
+        encoder = Mock()
+        encoder.encode.side_effect = str.split
+        fake_tiktoken = Mock()
+        fake_tiktoken.get_encoding.return_value = encoder
+        token_manager = TokenManager(config, Mock())
+        optimizer = ToolOptimizer(config, Mock(), token_manager)
+        messages = [
+            {"role": "system", "content": "You are a terminal assistant."},
+            {"role": "user", "content": "list the files here"},
+        ]
+
+        with patch("aixterm.context.token_manager.tiktoken", fake_tiktoken):
+            optimizer._count_message_tokens(messages, "local-model")
+            messages.append({"role": "assistant", "content": "running ls"})
+            messages.append({"role": "tool", "tool_call_id": "1", "content": "a b"})
+
+            with patch.object(
+                token_manager,
+                "count_tokens_for_messages",
+                wraps=token_manager.count_tokens_for_messages,
+            ) as count:
+                tokens = optimizer._count_message_tokens(messages, "local-model")
+
+            assert count.call_args[0][0] == messages[2:]
+            assert tokens == token_manager.count_tokens_for_messages(
+                messages, "local-model"
+            )
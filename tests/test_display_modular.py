@@ -24,11 +24,15 @@ def test_message_types():
     from aixterm.display.types import MessageType
 
     # Test that all message types can be instantiated
-    assert MessageType.INFO.value == "info"
-    assert MessageType.WARNING.value == "warning"
-    assert MessageType.ERROR.value == "error"
-    assert MessageType.SUCCESS.value == "success"
-    assert MessageType.TOOL_CALL.value == "tool_call"
+    assert MessageType.INFO.value == 0
+    assert MessageType.WARNING.value == 1
+    assert MessageType.ERROR.value == 2
+    assert MessageType.SUCCESS.value == 3
+    assert MessageType.TOOL_CALL.value == 4
+
+    # Test that message types compare and hash as plain ints
+    assert MessageType.ERROR == 2
+    assert {MessageType.WARNING: "w"}[1] == "w"
 
 
 def test_create_display_manager():
@@ -42,3 +46,196 @@ def test_create_display_manager():
     # Test with explicit display type
     manager = aixterm.display.create_display_manager("spinner")
     assert manager.default_display_type == aixterm.display.DisplayType.SPINNER
+
+
+def test_progress_updates_are_coalesced():
+    """Test that queued updates to the same display collapse to the latest."""
+    from unittest.mock import Mock
+
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager()
+    manager.shutdown()
+
+    first, second = Mock(), Mock()
+    for item in [
+        (first, 1, "step", None),
+        (first, 2, None, 10),
+        (second, 5, None, None),
+        (first, 3, None, None),
+        None,
+    ]:
+        manager._update_queue.put(item)
+    manager._update_worker()
+
+    assert [c.args for c in first.update.call_args_list] == [
+        (2, "step", 10),
+        (3, None, None),
+    ]
+    second.update.assert_called_once_with(5, None, None)
+
+
+def test_stream_content_filters_thinking_across_chunks(capsys):
+    """Test that thinking blocks are hidden even when split across chunks."""
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager()
+    try:
+        manager.start_streaming(clear_progress=False)
+        shown = manager.stream_content("a<thinking>x</thinking>b<thinking>y")
+        shown += manager.stream_content("z</thinking>c")
+        manager.end_streaming()
+    finally:
+        manager.shutdown()
+
+    assert shown == "abc"
+    assert capsys.readouterr().out == "abc\n"
+
+
+def test_uncontended_progress_update_runs_inline():
+    """Test that an update with nothing in flight is applied synchronously."""
+    from unittest.mock import Mock
+
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager()
+    try:
+        display = Mock()
+        manager._active_progress["job"] = display
+        manager.update_progress("job", 7, "halfway")
+        display.update.assert_called_once_with(7, "halfway", None)
+    finally:
+        manager._active_progress.clear()
+        manager.shutdown()
+
+
+def test_inline_update_never_overtakes_dequeued_update():
+    """Test that an update is not applied inline ahead of one the worker holds."""
+    import queue
+    import threading
+    from unittest.mock import Mock
+
+    import aixterm.display
+
+    picked, resume = threading.Event(), threading.Event()
+
+    class StallingQueue(queue.Queue):
+        """Pause the worker right after it dequeues an update."""
+
+        def get(self, block=True, timeout=None):
+            item = super().get(block, timeout)
+            if item is not None and not resume.is_set():
+                picked.set()
+                resume.wait(5)
+            return item
+
+    manager = aixterm.display.create_display_manager()
+    manager._update_queue.put(None)
+    manager._update_thread.join(timeout=1)
+    manager._update_queue = StallingQueue()
+    manager._update_thread = threading.Thread(
+        target=manager._update_worker, daemon=True
+    )
+    manager._update_thread.start()
+
+    display = Mock()
+    manager._active_progress["job"] = display
+    try:
+        # Force the first update onto the queue, then let the worker take it
+        with manager._update_inflight:
+            manager.update_progress("job", 1)
+        assert picked.wait(5)
+
+        # The worker holds update 1 but has not applied it yet
+        manager.update_progress("job", 2)
+        resume.set()
+
+        # Drain the worker, then the newest update must be the one on screen
+        manager._update_queue.put(None)
+        manager._update_thread.join(timeout=5)
+        assert display.update.call_args.args[0] == 2
+    finally:
+        resume.set()
+        manager._active_progress.clear()
+        manager.shutdown()
+
+
+def test_indeterminate_progress_becomes_determinate_in_place():
+    """Test that learning a total resets the existing tqdm instead of recreating it."""
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager("bar")
+    try:
+        progress = manager.create_progress("job", "Working", total=None)
+        bar = progress._tqdm
+        assert bar is not None
+
+        progress.update(6, total=10)
+
+        assert progress._tqdm is bar
+        assert bar.total == 10
+        assert bar.n == 6
+        assert "{percentage" in bar.bar_format
+    finally:
+        manager.shutdown()
+
+
+def test_progress_rate_limit_drops_only_small_rapid_steps():
+    """Test that rapid small steps are skipped but new totals always apply."""
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager("bar")
+    try:
+        progress = manager.create_progress("job", "Working", total=None)
+
+        progress.update(1)
+        progress.update(2)  # within the interval and a small step
+        assert progress.current_progress == 1
+
+        progress.update(3, total=50)
+        assert progress.current_progress == 3
+        assert progress.total == 50
+    finally:
+        manager.shutdown()
+
+
+def test_status_batch_defers_info_but_not_errors(capsys):
+    """Test that batched status messages are written together on exit."""
+    import aixterm.display
+
+    manager = aixterm.display.create_display_manager()
+    try:
+        with manager.status.batch():
+            manager.show_info("first")
+            manager.show_info("second")
+            assert capsys.readouterr().out == ""
+            manager.show_error("boom")
+            assert capsys.readouterr().out == "first\nsecond\nError: boom\n"
+            manager.show_info("third")
+        assert capsys.readouterr().out == "third\n"
+    finally:
+        manager.shutdown()
+
+
+def test_elapsed_time_respects_cached_timing_flag(monkeypatch, capsys):
+    """Test that elapsed time output follows the cached AIXTERM_SHOW_TIMING flag."""
+    import aixterm.display
+    from aixterm.display.status import refresh_timing_flag
+
+    manager = aixterm.display.create_display_manager()
+    try:
+        monkeypatch.setenv("AIXTERM_SHOW_TIMING", "1")
+        assert refresh_timing_flag() is True
+        manager.status.show_elapsed_time(0.05)
+        manager.status.show_elapsed_time(2.5)
+        manager.status.show_elapsed_time(75)
+        assert capsys.readouterr().out == (
+            "[Completed in 50ms]\n[Completed in 2.50s]\n[Completed in 1m 15.0s]\n"
+        )
+
+        monkeypatch.delenv("AIXTERM_SHOW_TIMING")
+        assert refresh_timing_flag() is False
+        manager.status.show_elapsed_time(2.5)
+        assert capsys.readouterr().out == ""
+    finally:
+        manager.shutdown()
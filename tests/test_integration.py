@@ -115,16 +115,15 @@ class TestAIxTermIntegration:
                             # Should have run cleanup
                             mock_cleanup.assert_called_once()
 
-    def test_list_tools_no_servers(self, mock_config):
+    def test_list_tools_no_servers(self, mock_config, capsys):
         """Test listing tools when no MCP servers are configured."""
         app = AIxTerm()
 
-        with patch("builtins.print") as mock_print:
-            app.list_tools()
+        app.list_tools()
 
-            mock_print.assert_any_call("No MCP servers configured.")
+        assert "No MCP servers configured." in capsys.readouterr().out.splitlines()
 
-    def test_list_tools_with_servers(self, mock_config):
+    def test_list_tools_with_servers(self, mock_config, capsys):
         """Test listing tools with MCP servers configured."""
         mock_config._config["mcp_servers"] = [
             {
@@ -150,15 +149,15 @@ class TestAIxTermIntegration:
             with patch.object(
                 app.mcp_client, "get_available_tools", return_value=mock_tools
             ):
-                with patch("builtins.print") as mock_print:
-                    app.list_tools()
+                app.list_tools()
 
-                    # Should print tool information
-                    mock_print.assert_any_call("\nAvailable MCP Tools:")
-                    mock_print.assert_any_call("\nServer: test-server")
-                    mock_print.assert_any_call("  test_tool: A test tool")
+                # Should print tool information
+                out = capsys.readouterr().out
+                assert "\nAvailable MCP Tools:\n" in out
+                assert "\nServer: test-server\n" in out
+                assert "  test_tool: A test tool\n" in out
 
-    def test_status_command(self, mock_config):
+    def test_status_command(self, mock_config, capsys):
         """Test status command output."""
         app = AIxTerm()
 
@@ -175,17 +174,15 @@ class TestAIxTermIntegration:
                         "next_cleanup_due": "2024-01-02T12:00:00",
                     }
 
-                    with patch("builtins.print") as mock_print:
-                        app.status()
+                    app.status()
 
-                        # Should print status information
-                        mock_print.assert_any_call("AIxTerm Status")
-                        # New condensed cleanup status line
-                        mock_print.assert_any_call(
-                            "Cleanup: last=Never next=unknown items=0 freed=0"
-                        )
+                    # Should print status information
+                    lines = capsys.readouterr().out.splitlines()
+                    assert "AIxTerm Status" in lines
+                    # New condensed cleanup status line
+                    assert "Cleanup: last=Never next=unknown items=0 freed=0" in lines
 
-    def test_cleanup_now_command(self, mock_config):
+    def test_cleanup_now_command(self, mock_config, capsys):
         """Test cleanup now command."""
         app = AIxTerm()
 
@@ -202,13 +199,13 @@ class TestAIxTermIntegration:
             "run_cleanup",
             return_value=mock_results,
         ):
-            with patch("builtins.print") as mock_print:
-                app.cleanup_now()
+            app.cleanup_now()
 
-                # Should print cleanup results
-                mock_print.assert_any_call("Running cleanup...")
-                mock_print.assert_any_call("Cleanup completed:")
-                mock_print.assert_any_call("  Log files removed: 3")
+            # Should print cleanup results
+            lines = capsys.readouterr().out.splitlines()
+            assert "Running cleanup..." in lines
+            assert "Cleanup completed:" in lines
+            assert "  Log files removed: 3" in lines
 
     def test_shutdown(self, mock_config):
         """Test application shutdown."""
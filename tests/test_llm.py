@@ -1,10 +1,11 @@
 """Tests for LLM client functionality."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from aixterm.llm import LLMError
+from aixterm.llm.tools import ToolHandler
 
 
 class TestLLMClient:
@@ -415,6 +416,77 @@ class TestLLMClient:
         assert "Here's my response." in response
         assert "I need to think about this" not in response
 
+    def test_achat_completion_runs_concurrently(self, llm_client):
+        """Test that async completions are in flight at the same time."""
+        import asyncio
+
+        def make_response(content):
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = content
+            return response
+
+        async def run_both():
+            # Each request waits for the other to start, so the calls only
+            # finish if achat_completion lets them overlap
+            started = [asyncio.Event(), asyncio.Event()]
+            contents = ["first", "<thinking>x</thinking>second"]
+
+            async def create(**params):
+                index = sum(event.is_set() for event in started)
+                started[index].set()
+                await asyncio.wait_for(started[1 - index].wait(), timeout=5)
+                return make_response(contents[index])
+
+            async_client = Mock()
+            async_client.chat.completions.create = create
+            with patch.object(
+                llm_client, "_get_async_openai_client", return_value=async_client
+            ):
+                return await asyncio.gather(
+                    llm_client.achat_completion(messages),
+                    llm_client.achat_completion(messages),
+                )
+
+        messages = [{"role": "user", "content": "Hello"}]
+        responses = asyncio.run(run_both())
+
+        assert [r.strip() for r in responses] == ["first", "second"]
+
+    def test_achat_completion_across_event_loops(self, llm_client):
+        """Test that each asyncio.run() gets an async client for its own loop."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "hi"
+        clients = []
+
+        def make_client(**kwargs):
+            client = Mock()
+            client.chat.completions.create = AsyncMock(return_value=response)
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+
+        messages = [{"role": "user", "content": "Hello"}]
+        with patch("aixterm.llm.client.AsyncOpenAI", side_effect=make_client):
+            assert asyncio.run(llm_client.achat_completion(messages)) == "hi"
+            assert asyncio.run(llm_client.achat_completion(messages)) == "hi"
+
+            async def reuse_then_close():
+                await llm_client.achat_completion(messages)
+                await llm_client.achat_completion(messages)
+                await llm_client.aclose()
+
+            asyncio.run(reuse_then_close())
+
+        assert len(clients) == 3
+        assert clients[2].chat.completions.create.await_count == 2
+        clients[2].close.assert_awaited_once()
+        assert llm_client._async_openai_client is None
+
     def test_streaming_thinking_content_filtering(self, llm_client):
         """Test that thinking content is filtered during streaming."""
         from unittest.mock import patch
@@ -456,6 +528,72 @@ class TestLLMClient:
         printed_output = captured_output.getvalue()
         assert "Let me think about this" not in printed_output
 
+    def test_role_validation_extends_grown_tool_conversation(self, llm_client):
+        """Appending to a validated tool conversation matches a full pass."""
+        validator = llm_client.message_validator
+        messages = [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "list files"},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "tool_call_id": "1", "content": "a.txt"},
+        ]
+        validator.validate_and_fix_role_alternation(messages)
+
+        messages.append({"role": "system", "content": "dropped"})
+        messages.append({"role": "assistant", "content": "done"})
+        result = validator.validate_and_fix_role_alternation(messages)
+
+        validator._last_tool_validation = None
+        assert result == validator.validate_and_fix_role_alternation(messages)
+
+        # A replaced system prompt is not served from the cached result
+        messages[0] = {"role": "system", "content": "new sys"}
+        assert validator.validate_and_fix_role_alternation(messages)[0] is messages[0]
+        assert [m["role"] for m in result] == [
+            "system",
+            "user",
+            "assistant",
+            "tool",
+            "assistant",
+        ]
+
+    def test_tool_calls_in_one_turn_run_concurrently(self):
+        """Independent tool calls overlap and results keep call order."""
+        import threading
+
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: default
+        barrier = threading.Barrier(2, timeout=5)
+
+        def call_tool(name, server, arguments):
+            barrier.wait()  # Only returns once both calls are in flight
+            return f"{name} done"
+
+        mcp_client = Mock()
+        mcp_client.call_tool.side_effect = call_tool
+        display_manager = MagicMock()
+        handler = ToolHandler(config, mcp_client, Mock(), display_manager)
+        tools = [
+            {"function": {"name": "first"}, "server": "s"},
+            {"function": {"name": "second"}, "server": "s"},
+        ]
+        tool_calls = [
+            {"id": "a", "function": {"name": "first", "arguments": "{}"}},
+            {"id": "b", "function": {"name": "second", "arguments": "{}"}},
+        ]
+        messages = []
+
+        with patch("aixterm.context.token_manager.tiktoken", None):
+            handler.process_tool_calls(tool_calls, messages, tools, 1, 4096)
+
+        # Both calls are announced through the display manager, not print
+        assert display_manager.show_tool_call.call_count == 2
+
+        assert [(m["tool_call_id"], m["content"]) for m in messages] == [
+            ("a", "first done"),
+            ("b", "second done"),
+        ]
+
     def _create_chunk(self, content):
         """Helper to create a mock streaming chunk."""
         from unittest.mock import MagicMock
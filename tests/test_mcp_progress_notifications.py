@@ -325,6 +325,27 @@ class TestMCPClient(unittest.TestCase):
         # Verify progress callbacks were made
         self.assertEqual(callback_func.call_count, 2)  # Start and completion
 
+    def test_progress_tokens_unique_within_same_millisecond(self):
+        """Calls started in the same millisecond get distinct progress tokens."""
+        mock_server = Mock()
+        mock_server.is_running.return_value = True
+        self.client.servers["test-server"] = mock_server
+        self.client._initialized = True
+
+        first, second = Mock(), Mock()
+        with patch("aixterm.mcp_client.time.time", return_value=1000.0):
+            self.client.call_tool_with_progress(
+                "a", "test-server", {}, progress_callback=first
+            )
+            self.client.call_tool_with_progress(
+                "b", "test-server", {}, progress_callback=second
+            )
+
+        self.assertNotEqual(
+            first.call_args[0][0].progress_token,
+            second.call_args[0][0].progress_token,
+        )
+
     def test_call_tool_with_progress_no_callback(self):
         """Test calling tool with progress but no callback."""
         mock_server = Mock()
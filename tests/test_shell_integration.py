@@ -1,5 +1,7 @@
 """Tests for shell integration modules."""
 
+import os
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -167,6 +169,31 @@ class TestBash:
         result = integration.is_available()
         assert isinstance(result, bool)
 
+    def test_version_probe_runs_once(self):
+        """Test that availability and version share one cached --version call."""
+        integration = Bash()
+
+        with patch(
+            "aixterm.integration.base.subprocess.check_output",
+            return_value=b"GNU bash, version 5.2.15\nmore\n",
+        ) as check_output:
+            assert integration.is_available() is True
+            assert integration.get_current_shell_version() == "GNU bash, version 5.2.15"
+            assert integration.is_available() is True
+            assert check_output.call_count == 1
+
+    def test_version_probe_failure_is_cached(self):
+        """Test that a failing --version call marks the shell unavailable."""
+        integration = Bash()
+
+        with patch(
+            "aixterm.integration.base.subprocess.check_output",
+            side_effect=subprocess.CalledProcessError(1, ["bash", "--version"]),
+        ) as check_output:
+            assert integration.is_available() is False
+            assert integration.get_current_shell_version() is None
+            assert check_output.call_count == 1
+
     def test_validate_integration_environment(self):
         """Test bash environment validation."""
         integration = Bash()
@@ -217,6 +244,33 @@ class TestZsh:
         assert "aixterm_status" in script  # status function
         assert "aixterm_cleanup_logs" in script  # cleanup function
 
+    def test_is_available_uses_path_lookup(self):
+        """Test that zsh availability is answered from PATH without a subprocess."""
+        integration = Zsh()
+
+        with patch(
+            "aixterm.integration.zsh.shutil.which", return_value="/usr/bin/zsh"
+        ) as which, patch("aixterm.integration.base.subprocess.check_output") as check_output:
+            assert integration.is_available() is True
+            assert integration.is_available() is True
+            assert which.call_count == 1
+            check_output.assert_not_called()
+
+    def test_version_lookup_spawns_zsh_once(self):
+        """Test that an availability check plus version lookup forks once."""
+        integration = Zsh()
+
+        with patch(
+            "aixterm.integration.zsh.shutil.which", return_value="/usr/bin/zsh"
+        ), patch(
+            "aixterm.integration.base.subprocess.check_output",
+            return_value=b"zsh 5.9 (x86_64-pc-linux-gnu)\n",
+        ) as check_output:
+            if integration.is_available():
+                assert integration.get_current_shell_version() == "zsh 5.9 (x86_64-pc-linux-gnu)"
+            assert integration.get_current_shell_version() == "zsh 5.9 (x86_64-pc-linux-gnu)"
+            assert check_output.call_count == 1
+
     def test_detect_framework(self):
         """Test zsh framework detection."""
         integration = Zsh()
@@ -226,6 +280,18 @@ class TestZsh:
         # Should return None if no framework detected, or a string if detected
         assert framework is None or isinstance(framework, str)
 
+    def test_detect_framework_is_cached(self):
+        """Test that framework detection probes the environment once."""
+        integration = Zsh()
+
+        with patch.dict(os.environ, {"ZSH": "/home/user/.oh-my-zsh"}):
+            assert integration.detect_framework() == "oh-my-zsh"
+        # Later environment changes are not re-probed
+        with patch.dict(os.environ, {"ZSH": ""}):
+            assert integration.detect_framework() == "oh-my-zsh"
+            notes = integration.get_framework_compatibility_notes()
+        assert notes[0] == "Detected framework: oh-my-zsh"
+
     def test_framework_compatibility_notes(self):
         """Test framework compatibility notes."""
         integration = Zsh()
@@ -300,7 +366,7 @@ class TestShellIntegrationInstallation:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             config_file = Path(temp_dir) / ".bashrc"
-            home_patch = patch("pathlib.Path.home", return_value=Path(temp_dir))
+            home_patch = patch("aixterm.integration.base._get_home", return_value=Path(temp_dir))
 
             with home_patch:
                 with patch.object(integration, "find_config_file", return_value=config_file):
@@ -335,7 +401,7 @@ class TestShellIntegrationInstallation:
                 '# Existing content\n# AIxTerm Shell Integration\nif [ -f "$HOME/.aixterm/bash.rc" ]; then\n    . "$HOME/.aixterm/bash.rc"\nfi\n# More content\n'
             )
 
-            with patch("pathlib.Path.home", return_value=Path(temp_dir)):
+            with patch("aixterm.integration.base._get_home", return_value=Path(temp_dir)):
                 with patch.object(integration, "find_config_file", return_value=config_file):
                     result = integration.uninstall()
 
@@ -353,7 +419,7 @@ class TestShellIntegrationInstallation:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             config_file = Path(temp_dir) / ".bashrc"
-            home_patch = patch("pathlib.Path.home", return_value=Path(temp_dir))
+            home_patch = patch("aixterm.integration.base._get_home", return_value=Path(temp_dir))
             with home_patch:
                 with patch.object(integration, "find_config_file", return_value=config_file):
                     with patch.object(integration, "is_available", return_value=True):
@@ -373,6 +439,82 @@ class TestShellIntegrationInstallation:
                             content = config_file.read_text()
                             assert content.count(".aixterm/bash.rc") == 1
 
+    def test_remove_fish_snippet_keeps_following_content(self):
+        """Test that removing the fish snippet stops at its closing 'end'."""
+        integration = Fish()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.fish"
+            snippet = integration._get_source_snippet(Path(temp_dir) / "fish.rc")
+            config_file.write_text(f"set -x EDITOR vim{snippet}\nalias ll 'ls -l'\n")
+
+            assert integration._remove_existing_integration(config_file) is True
+            assert config_file.read_text() == "set -x EDITOR vim\nalias ll 'ls -l'\n"
+
+    def test_zsh_snippet_compiles_rc_and_is_removable(self):
+        """Test that the zsh snippet zcompiles the rc file and still uninstalls cleanly."""
+        integration = Zsh()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / ".zshrc"
+            snippet = integration._get_source_snippet(Path(temp_dir) / "zsh.rc")
+            assert 'zcompile "$AIXTERM_RC"' in snippet
+            config_file.write_text(f"export EDITOR=vim{snippet}\nalias ll='ls -l'\n")
+
+            assert integration._installed_in_text(config_file.read_text())
+            assert integration._remove_existing_integration(config_file) is True
+            assert config_file.read_text() == "export EDITOR=vim\nalias ll='ls -l'\n"
+
+    def test_is_integration_installed_reuses_result_until_file_changes(self):
+        """Test that unchanged config files are not re-read on status checks."""
+        integration = Bash()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / ".bashrc"
+            config_file.write_text("export EDITOR=vim\n")
+
+            with patch.object(
+                integration,
+                "_config_has_source_line",
+                wraps=integration._config_has_source_line,
+            ) as read_text:
+                assert integration.is_integration_installed(config_file) is False
+                assert integration.is_integration_installed(config_file) is False
+                assert read_text.call_count == 1
+
+                config_file.write_text(
+                    "export EDITOR=vim\n" + integration._get_source_snippet(Path("bash.rc"))
+                )
+                assert integration.is_integration_installed(config_file) is True
+                assert read_text.call_count == 2
+
+            # Fresh instances, as built per status request, share the cache
+            fresh = Bash()
+            with patch.object(fresh, "_config_has_source_line") as fresh_read:
+                assert fresh.is_integration_installed(config_file) is True
+                fresh_read.assert_not_called()
+
+    def test_remove_snippet_rewrites_symlinked_config_in_place(self):
+        """Test that removal keeps symlinks and permissions and leaves no temp file."""
+        integration = Bash()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "dotfiles_bashrc"
+            snippet = integration._get_source_snippet(Path(temp_dir) / "bash.rc")
+            target.write_text(f"export EDITOR=vim{snippet}")
+            target.chmod(0o600)
+            config_file = Path(temp_dir) / ".bashrc"
+            config_file.symlink_to(target)
+
+            assert integration._remove_existing_integration(config_file) is True
+            assert config_file.is_symlink()
+            assert target.read_text() == "export EDITOR=vim\n"
+            assert target.stat().st_mode & 0o777 == 0o600
+            assert sorted(p.name for p in Path(temp_dir).iterdir()) == [
+                ".bashrc",
+                "dotfiles_bashrc",
+            ]
+
 
 class TestTTYLogging:
     """Test cases for TTY-specific logging functionality."""